@@ -0,0 +1,48 @@
+"""ensure unique index on kol_pulse_item.external_id for ON CONFLICT ingest
+
+Revision ID: e2b3c4d5e6f7
+Revises: d1a2b3c4d5e6
+Create Date: 2026-02-15
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'e2b3c4d5e6f7'
+down_revision = 'd1a2b3c4d5e6'
+branch_labels = None
+depends_on = None
+
+
+def _has_unique_external_id(inspector):
+    for idx in inspector.get_indexes('kol_pulse_item'):
+        if idx.get('unique') and idx.get('column_names') == ['external_id']:
+            return True
+    for uc in inspector.get_unique_constraints('kol_pulse_item'):
+        if uc.get('column_names') == ['external_id']:
+            return True
+    return False
+
+
+def upgrade():
+    # ingest_pulse relies on INSERT ... ON CONFLICT (external_id); tables created via
+    # create_all already carry ix_kol_pulse_item_external_id, so only add it when missing.
+    inspector = sa.inspect(op.get_bind())
+    if 'kol_pulse_item' not in inspector.get_table_names():
+        return
+    if _has_unique_external_id(inspector):
+        return
+    with op.batch_alter_table('kol_pulse_item', schema=None) as batch_op:
+        batch_op.create_index('uq_kol_pulse_item_external_id', ['external_id'], unique=True)
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    if 'kol_pulse_item' not in inspector.get_table_names():
+        return
+    if 'uq_kol_pulse_item_external_id' not in {i['name'] for i in inspector.get_indexes('kol_pulse_item')}:
+        return
+    with op.batch_alter_table('kol_pulse_item', schema=None) as batch_op:
+        batch_op.drop_index('uq_kol_pulse_item_external_id')
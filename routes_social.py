@@ -106,8 +106,8 @@ def monitor_content_impl():
     trends = []
     
     # Reddit
-    for sub in ['cryptocurrency', 'bitcoin', 'ethtrader', 'satoshistreetbets', 'cryptomarkets', 'cryptotechnology', 'defi', 'altcoin']:
-        posts = reddit.get_trending_topics([sub], limit=2)
+    reddit_subs = ['cryptocurrency', 'bitcoin', 'ethtrader', 'satoshistreetbets', 'cryptomarkets', 'cryptotechnology', 'defi', 'altcoin']
+    for posts in reddit.get_trending_topics_by_subreddit(reddit_subs, limit=2).values():
         for post in posts:
             screenshot = take_screenshot(post['permalink'])
             screenshot_text = extract_screenshot_text(screenshot)
@@ -222,7 +222,8 @@ def generate_article_with_tracking(force: bool = False) -> dict:
     Generate one article and record the run. Used by /api/trigger-automation.
     Skips if a run completed within the last SKIP_IF_RAN_WITHIN_MINUTES minutes (unless force=True).
     Articles are saved as published=True so they appear on the site immediately.
-    Returns: {success, title, article_id}, {skipped}, or {error}.
+    Returns: {success, title, article_id}, {skipped, reason}, or {error}.
+    reason is "dedup" (another run holds the lock) or "quota" (ran within the cooldown).
     """
     with app_context():
         from services.content_generator import auto_publish_enabled, validate_article_for_publish
@@ -232,7 +233,7 @@ def generate_article_with_tracking(force: bool = False) -> dict:
         # - force=True only bypasses the "ran recently" cooldown.
         run = acquire_lock(AUTOMATION_TASK_NAME, ttl_minutes=SKIP_IF_RAN_WITHIN_MINUTES)
         if not run:
-            return {"skipped": True, "message": "Another process is running"}
+            return {"skipped": True, "reason": "dedup", "message": "Another process is running"}
         if not force:
             recent = (
                 models.AutomationRun.query.filter_by(task_name=AUTOMATION_TASK_NAME)
@@ -243,7 +244,7 @@ def generate_article_with_tracking(force: bool = False) -> dict:
             if recent and recent.finished_at:
                 if datetime.utcnow() - recent.finished_at < timedelta(minutes=SKIP_IF_RAN_WITHIN_MINUTES):
                     release_lock(run, "skipped", "Ran recently")
-                    return {"skipped": True, "message": "Ran recently"}
+                    return {"skipped": True, "reason": "quota", "message": "Ran recently"}
         content_engine_error = None
         reddit_error = None
         topic = "Bitcoin network and market update"
@@ -400,7 +401,7 @@ def generate_breaking_article_with_tracking() -> dict:
     with app_context():
         run = acquire_lock(ARTICLE_AUTOMATION_TASK_NAME, ttl_minutes=14)
         if not run:
-            return {"skipped": True, "message": "Another process is running"}
+            return {"skipped": True, "reason": "dedup", "message": "Another process is running"}
         try:
             from services.content_generator import (
                 ContentGenerator,
@@ -414,7 +415,7 @@ def generate_breaking_article_with_tracking() -> dict:
             topic = get_unique_topic()
             if not topic:
                 release_lock(run, "skipped", "No unique topics available")
-                return {"skipped": True, "message": "No unique topics available"}
+                return {"skipped": True, "reason": "dedup", "message": "No unique topics available"}
 
             gen = ContentGenerator()
             article_data = gen.generate_article(topic=topic, content_type="breaking_news", source_type="ai_generated")
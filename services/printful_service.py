@@ -3,6 +3,15 @@ import logging
 from typing import List, Dict, Optional
 import os
 
+# Gildan 64000 Softstyle (black) variant IDs and retail prices used for RTSA drops.
+RTSA_VARIANTS = (
+    (4012, "35.00"),
+    (4013, "35.00"),
+    (4014, "35.00"),
+    (4015, "37.00"),
+    (4016, "37.00"),
+)
+
 class PrintfulService:
     """Service for integrating with Printful API for merch store"""
     
@@ -16,6 +25,8 @@ class PrintfulService:
         self.logger = logging.getLogger(__name__)
         self.api_key = os.environ.get('PRINTFUL_API_KEY')
         self.base_url = 'https://api.printful.com'
+        # Shared session keeps the HTTPS connection to Printful warm across calls.
+        self.session = requests.Session()
         
         if not self.api_key:
             self.logger.warning("PRINTFUL_API_KEY not configured - merch functionality disabled")
@@ -38,7 +49,7 @@ class PrintfulService:
         for store in self.STORES:
             try:
                 headers = self._get_headers(store['id'])
-                response = requests.get(
+                response = self.session.get(
                     f'{self.base_url}/sync/products',
                     headers=headers,
                     timeout=30
@@ -77,7 +88,7 @@ class PrintfulService:
         
         try:
             headers = self._get_headers(store_id)
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/sync/products/{product_id}',
                 headers=headers,
                 timeout=30
@@ -121,7 +132,7 @@ class PrintfulService:
             if confirm:
                 url += '?confirm=true'
             
-            response = requests.post(
+            response = self.session.post(
                 url,
                 headers=headers,
                 json=order_data,
@@ -151,7 +162,7 @@ class PrintfulService:
         
         try:
             headers = self._get_headers(store_id)
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/sync/variant/{variant_id}',
                 headers=headers,
                 timeout=30
@@ -178,7 +189,7 @@ class PrintfulService:
             }
             
             headers = self._get_headers(self.STORES[0]['id'])
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/shipping/rates',
                 headers=headers,
                 json=shipping_data,
@@ -282,60 +293,16 @@ class PrintfulService:
                 },
                 "sync_variants": [
                     {
-                        "variant_id": 4012,
-                        "retail_price": "35.00",
-                        "files": [
-                            {
-                                "url": design_url,
-                                "type": "front"
-                            }
-                        ]
-                    },
-                    {
-                        "variant_id": 4013,
-                        "retail_price": "35.00",
-                        "files": [
-                            {
-                                "url": design_url,
-                                "type": "front"
-                            }
-                        ]
-                    },
-                    {
-                        "variant_id": 4014,
-                        "retail_price": "35.00",
-                        "files": [
-                            {
-                                "url": design_url,
-                                "type": "front"
-                            }
-                        ]
-                    },
-                    {
-                        "variant_id": 4015,
-                        "retail_price": "37.00",
-                        "files": [
-                            {
-                                "url": design_url,
-                                "type": "front"
-                            }
-                        ]
-                    },
-                    {
-                        "variant_id": 4016,
-                        "retail_price": "37.00",
-                        "files": [
-                            {
-                                "url": design_url,
-                                "type": "front"
-                            }
-                        ]
+                        "variant_id": variant_id,
+                        "retail_price": retail_price,
+                        "files": [{"url": design_url, "type": "front"}]
                     }
+                    for variant_id, retail_price in RTSA_VARIANTS
                 ]
             }
             
             headers = self._get_headers(store_id)
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/sync/products',
                 headers=headers,
                 json=product_data,
@@ -368,7 +335,7 @@ class PrintfulService:
             return []
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/products/{product_id}',
                 headers={'Authorization': f'Bearer {self.api_key}'},
                 timeout=30
@@ -5,16 +5,18 @@ from typing import Dict
 
 from app import app, db
 import models
-from services.channel_monitor import channel_monitor_service
-from services.highlight_extractor import highlight_extractor_service
-from services.commentary_generator import commentary_generator_service
-from services.global_relay import global_relay_service
 
 
 class PulseDropBuilderService:
     """Force-run builder for end-to-end Pulse Drop alpha execution."""
 
     def force_build(self) -> Dict:
+        # Pipeline services pull in YouTube/OpenAI/HTTP clients; import on demand to keep worker startup light.
+        from services.channel_monitor import channel_monitor_service
+        from services.highlight_extractor import highlight_extractor_service
+        from services.commentary_generator import commentary_generator_service
+        from services.global_relay import global_relay_service
+
         with app.app_context():
             # Hard reset recent rows to guarantee deterministic alpha run.
             cutoff = datetime.utcnow() - timedelta(days=2)
@@ -27,11 +29,12 @@ class PulseDropBuilderService:
                 hours_back=24,
                 tone="Sovereign, High-Intelligence, No-Nonsense.",
             )
-            segments = (
-                models.PulseSegment.query.order_by(models.PulseSegment.priority.desc(), models.PulseSegment.created_at.desc())
+            seg = models.PulseSegment
+            segments = db.session.execute(
+                db.select(seg.label, seg.start_sec, seg.video_id, seg.commentary_audio)
+                .order_by(seg.priority.desc(), seg.created_at.desc())
                 .limit(50)
-                .all()
-            )
+            ).all()
             relay = global_relay_service.broadcast_pulse_drop(
                 reel_link="https://protocolpulse.io/pulse-drop",
                 segments=[
@@ -2,19 +2,182 @@
 Sovereign Intelligence Nexus — KOL Pulse feed.
 Aggregates real-time signals from X, Nostr, and YouTube into a single Command Log stream.
 """
+import atexit
 import json
 import logging
-import os
+import math
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from urllib.parse import urlparse
+import requests
 import websocket
 
+from services.rate_limiter import TokenBucket
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 KOL_LIST_PATH = Path(__file__).resolve().parents[1] / "config" / "kol_list.json"
+_KOL_CACHE = {"mtime": 0, "data": None}
+
+_TWEET_ID_RE = re.compile(r"(?:twitter\.com|x\.com)/\w+/status/(\d+)", re.I)
+_PLACEHOLDER_MARKERS = (
+    "bitcoin alpha flows here",
+    "bitcoin signal on nostr",
+    "new content from partner channel",
+)
+# Single-pass, case-insensitive scan for bitcoin topics in Nostr notes.
+_BTC_WORDS_RE = re.compile(r"bitcoin|btc|sats|lightning|mempool|hashrate|mining", re.I)
+
+# http(s) scheme followed by a non-empty netloc.
+_HTTP_URL_RE = re.compile(r"https?://[^/?#]", re.I)
+
+X_FETCH_WORKERS = 8
+X_HANDLE_TIMEOUT = 4  # seconds per wave of handle lookups
+X_USER_ID_TTL = 86400  # handles rarely change owner; re-resolve ids daily
+_X_USER_IDS = {}  # lowercased username -> (user_id, resolved_at)
+
+# Pull from major relays directly so this still works when third-party APIs are flaky.
+NOSTR_RELAYS = (
+    "wss://relay.damus.io",
+    "wss://relay.primal.net",
+    "wss://nos.lol",
+)
+
+
+class _RelayPool:
+    """Keeps one persistent WebSocket per Nostr relay so ingest cycles skip the TLS/WS handshake.
+
+    Also serves as the relay health cache: a relay that fails is skipped outright for a
+    backoff window, then must answer a NIP-11 probe before another WebSocket dial.
+    """
+
+    IDLE_SECONDS = 30
+    CONNECT_TIMEOUT = 6
+    PROBE_TIMEOUT = 2
+    MIN_BACKOFF = 60
+    MAX_BACKOFF = 300
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._conns = {}  # url -> (ws, last_activity)
+        self._failures = {}  # url -> (consecutive_failures, retry_after)
+
+    def acquire(self, url):
+        """Check out a healthy connection for url, dialing a new one if needed. Raises on failure."""
+        now = time.monotonic()
+        with self._lock:
+            failures, retry_after = self._failures.get(url, (0, 0.0))
+            if now < retry_after:
+                raise ConnectionError(f"relay {url} backing off")
+            ws, last_activity = self._conns.pop(url, (None, 0.0))
+        if ws is not None:
+            if ws.connected and now - last_activity < self.IDLE_SECONDS:
+                return ws
+            if ws.connected:
+                try:
+                    ws.ping()
+                    return ws
+                except Exception:
+                    pass
+            self._close(ws)
+        if failures and not self._probe(url):
+            # Recently dead relay still not answering NIP-11: skip without paying the WS connect timeout.
+            self.mark_failed(url)
+            raise ConnectionError(f"relay {url} failed NIP-11 probe")
+        try:
+            ws = websocket.create_connection(url, timeout=self.CONNECT_TIMEOUT)
+        except Exception:
+            self.mark_failed(url)
+            raise
+        with self._lock:
+            self._failures.pop(url, None)
+        return ws
+
+    @classmethod
+    def _probe(cls, url):
+        """NIP-11 relay information document over plain HTTPS; cheap liveness check before a WS dial."""
+        http_url = "https" + url[3:] if url.startswith("wss") else "http" + url[2:]
+        try:
+            resp = requests.get(
+                http_url,
+                headers={"Accept": "application/nostr+json"},
+                timeout=cls.PROBE_TIMEOUT,
+            )
+            return resp.ok
+        except Exception:
+            return False
+
+    def release(self, url, ws):
+        """Return a checked-out connection; an existing pooled one for the same relay wins."""
+        if ws is None or not ws.connected:
+            return
+        with self._lock:
+            if url not in self._conns:
+                self._conns[url] = (ws, time.monotonic())
+                return
+        self._close(ws)
+
+    def discard(self, url, ws):
+        self._close(ws)
+        self.mark_failed(url)
+
+    def mark_failed(self, url):
+        with self._lock:
+            failures = self._failures.get(url, (0, 0.0))[0] + 1
+            delay = min(self.MAX_BACKOFF, self.MIN_BACKOFF * 2 ** (failures - 1))
+            self._failures[url] = (failures, time.monotonic() + delay)
+
+    def close_all(self):
+        with self._lock:
+            conns = [ws for ws, _ in self._conns.values()]
+            self._conns.clear()
+        for ws in conns:
+            self._close(ws)
+
+    @staticmethod
+    def _close(ws):
+        try:
+            if ws:
+                ws.close()
+        except Exception:
+            pass
+
+
+NOSTR_RELAY_BUDGET = 2.5  # seconds of recv time per relay per call
+
+# Per-(caller, relay) NIP-01 ``since`` cursors, persisted so restarts do not replay the window.
+NOSTR_CURSOR_PATH = Path(__file__).resolve().parents[1] / "data" / "nostr_cursors.json"
+_NOSTR_CURSORS = None
+_nostr_cursor_lock = threading.Lock()
+
+_relay_pool = _RelayPool()
+atexit.register(_relay_pool.close_all)
+
+
+# X v2 limits are per endpoint, so each endpoint gets its own bucket sized to its 15-minute window:
+# GET /2/users/by allows 300 requests, GET /2/users/:id/tweets allows 900 (user context).
+_X_LOOKUP_BUCKET = TokenBucket(300, 300 / 900)
+_X_TIMELINE_BUCKET = TokenBucket(900, 900 / 900)
+# YouTube Data API: 10,000 quota units per day (channels.list / playlistItems.list cost 1 unit each).
+_YT_BUCKET = TokenBucket(10000, 10000 / 86400)
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 
 def _db():
@@ -28,45 +191,56 @@ def _models():
 
 
 def load_kol_list():
-    """Load KOL list from config. Returns dict with x_handles, nostr_pubkeys, youtube_channel_ids."""
+    """Load KOL list from config. Returns dict with x_handles, nostr_pubkeys, youtube_channel_ids.
+
+    Parsed once and reused until the file's mtime changes.
+    """
     try:
-        if KOL_LIST_PATH.exists():
-            with open(KOL_LIST_PATH, "r") as f:
-                return json.load(f)
+        mtime = KOL_LIST_PATH.stat().st_mtime
+    except FileNotFoundError:
+        mtime = -1
     except Exception as e:
         logger.warning("load_kol_list failed: %s", e)
-    return {"x_handles": [], "nostr_pubkeys": [], "youtube_channel_ids": []}
+        mtime = None
+    if mtime is not None and mtime == _KOL_CACHE["mtime"]:
+        return _KOL_CACHE["data"]
+    data = {"x_handles": [], "nostr_pubkeys": [], "youtube_channel_ids": []}
+    if mtime is not None and mtime != -1:
+        try:
+            with open(KOL_LIST_PATH, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning("load_kol_list failed: %s", e)
+            return data
+    if mtime is not None:
+        _KOL_CACHE["mtime"] = mtime
+        _KOL_CACHE["data"] = data
+    return data
 
 
 def _tweet_id_from_url(url):
     if not url:
         return None
-    m = re.search(r"(?:twitter\.com|x\.com)/\w+/status/(\d+)", url, re.I)
+    m = _TWEET_ID_RE.search(url)
     return m.group(1) if m else None
 
 
 def _valid_url(url):
-    try:
-        p = urlparse((url or "").strip())
-        return p.scheme in ("http", "https") and bool(p.netloc)
-    except Exception:
+    # Equivalent to urlparse scheme/netloc validation, without building a ParseResult per call.
+    if not url or not isinstance(url, str):
         return False
+    return _HTTP_URL_RE.match(url.strip()) is not None
 
 
 def _is_placeholder_item(item):
-    content = (item.get("content") or "").lower()
-    url = (item.get("url") or "").lower()
-    external_id = (item.get("external_id") or "").lower()
-    if "mock" in external_id:
+    # Cheap id/url checks first; only lowercase the (longer) content if those pass.
+    if "mock" in (item.get("external_id") or "").lower():
         return True
+    url = (item.get("url") or "").lower()
     if "/status/mock" in url or "watch?v=mock" in url:
         return True
-    generic_markers = (
-        "bitcoin alpha flows here",
-        "bitcoin signal on nostr",
-        "new content from partner channel",
-    )
-    return any(marker in content for marker in generic_markers)
+    content = (item.get("content") or "").lower()
+    return any(marker in content for marker in _PLACEHOLDER_MARKERS)
 
 
 def _load_collected_signal_feed(limit=80):
@@ -74,18 +248,29 @@ def _load_collected_signal_feed(limit=80):
     Pull recent verified X/Nostr signals from CollectedSignal.
     This is the same live signal well used by media intel pipelines.
     """
+    db = _db()
     models = _models()
-    rows = (
-        models.CollectedSignal.query
+    sig = models.CollectedSignal
+    rows = db.session.execute(
+        db.select(
+            sig.id,
+            sig.platform,
+            sig.author_handle,
+            sig.author_name,
+            db.func.substr(sig.content, 1, 260).label("content"),
+            sig.url,
+            sig.post_id,
+            sig.posted_at,
+            sig.collected_at,
+        )
         .filter(
-            models.CollectedSignal.is_verified == True,  # noqa: E712
-            models.CollectedSignal.platform.in_(["x", "nostr"]),
-            models.CollectedSignal.collected_at >= datetime.utcnow() - timedelta(hours=72),
+            sig.is_verified == True,  # noqa: E712
+            sig.platform.in_(["x", "nostr"]),
+            sig.collected_at >= datetime.utcnow() - timedelta(hours=72),
         )
-        .order_by(models.CollectedSignal.collected_at.desc())
+        .order_by(sig.collected_at.desc())
         .limit(max(limit * 2, 120))
-        .all()
-    )
+    ).all()
     out = []
     for r in rows:
         item = {
@@ -93,7 +278,7 @@ def _load_collected_signal_feed(limit=80):
             "platform": r.platform,
             "author_handle": r.author_handle,
             "author_name": r.author_name or r.author_handle,
-            "content": (r.content or "")[:260],
+            "content": r.content or "",
             "url": r.url,
             "external_id": f"signal_{r.platform}_{r.post_id}",
             "created_at": (r.posted_at or r.collected_at).isoformat() if (r.posted_at or r.collected_at) else None,
@@ -108,6 +293,64 @@ def _load_collected_signal_feed(limit=80):
     return out[:limit]
 
 
+def _resolve_x_user_ids(client, handles):
+    """Map username -> user_id with one users/by call, reusing cached ids for up to a day."""
+    now = time.monotonic()
+    ids = {}
+    missing = []
+    for name in handles:
+        cached = _X_USER_IDS.get(name.lower())
+        if cached and now - cached[1] < X_USER_ID_TTL:
+            ids[name] = cached[0]
+        else:
+            missing.append(name)
+    if missing and not _X_LOOKUP_BUCKET.acquire(timeout=X_HANDLE_TIMEOUT):
+        logger.warning("fetch_pulse_x: users/by rate budget exhausted, %d handle(s) unresolved", len(missing))
+    elif missing:
+        # users/by accepts up to 100 comma-joined usernames per request.
+        resp = client.get_users(usernames=missing[:100])
+        by_lower = {name.lower(): name for name in missing}
+        for user in resp.data or []:
+            name = by_lower.get(str(user.username).lower())
+            if name:
+                ids[name] = user.id
+                _X_USER_IDS[name.lower()] = (user.id, now)
+    return ids
+
+
+def _fetch_x_handle(client, handle, user_id, limit_per_user):
+    """Latest tweets for a single resolved handle via the v2 client; None when rate limited."""
+    out = []
+    if not _X_TIMELINE_BUCKET.acquire(timeout=X_HANDLE_TIMEOUT):
+        return None
+    tweets = client.get_users_tweets(
+        user_id,
+        max_results=min(limit_per_user, 5),
+        exclude=["retweets", "replies"],
+        tweet_fields=["created_at", "text"],
+        user_fields=["name"],
+        expansions=["author_id"]
+    )
+    if not tweets.data:
+        return out
+    users = {u.id: u for u in (tweets.includes.get("users") or [])}
+    for t in tweets.data:
+        author = users.get(t.author_id) if tweets.includes else None
+        author_name = author.name if author else handle
+        text = getattr(t, "text", t.get("text", "")) or ""
+        tweet_id = t.id
+        url = f"https://x.com/{handle}/status/{tweet_id}"
+        out.append({
+            "platform": "x",
+            "author_handle": handle,
+            "author_name": author_name,
+            "content": text[:500],
+            "url": url,
+            "external_id": f"x_{tweet_id}",
+        })
+    return out
+
+
 def fetch_pulse_x(handles, limit_per_user=3):
     """Fetch recent tweets from KOL X handles. Returns list of dicts {platform, author_handle, author_name, content, url, external_id}."""
     if not handles:
@@ -118,40 +361,38 @@ def fetch_pulse_x(handles, limit_per_user=3):
         svc = XService()
         if not getattr(svc, "client_v2", None):
             return []
-        for handle in handles[:20]:
-            try:
-                # v2: users/by/username, then tweets
-                user_resp = svc.client_v2.get_user(username=handle.strip().lstrip("@"))
-                if not user_resp.data:
-                    continue
-                user_id = user_resp.data.id
-                tweets = svc.client_v2.get_users_tweets(
-                    user_id,
-                    max_results=min(limit_per_user, 5),
-                    exclude=["retweets", "replies"],
-                    tweet_fields=["created_at", "text"],
-                    user_fields=["name"],
-                    expansions=["author_id"]
-                )
-                if not tweets.data:
+        batch = [h.strip().lstrip("@") for h in handles[:20] if h and h.strip()]
+        user_ids = _resolve_x_user_ids(svc.client_v2, batch)
+        if not user_ids:
+            return []
+        pool = ThreadPoolExecutor(max_workers=X_FETCH_WORKERS)
+        futs = {
+            pool.submit(_fetch_x_handle, svc.client_v2, h, uid, limit_per_user): h
+            for h, uid in user_ids.items()
+        }
+        # Cap tail latency: one slow handle must not hold up the whole ingest.
+        budget = X_HANDLE_TIMEOUT * -(-len(futs) // X_FETCH_WORKERS)
+        rate_limited = []
+        try:
+            for fut in as_completed(futs, timeout=budget):
+                try:
+                    items = fut.result()
+                except Exception as e:
+                    logger.debug("fetch_pulse_x handle %s: %s", futs[fut], e)
                     continue
-                users = {u.id: u for u in (tweets.includes.get("users") or [])}
-                for t in tweets.data:
-                    author = users.get(t.author_id) if tweets.includes else None
-                    author_name = author.name if author else handle
-                    text = getattr(t, "text", t.get("text", "")) or ""
-                    tweet_id = t.id
-                    url = f"https://x.com/{handle}/status/{tweet_id}"
-                    out.append({
-                        "platform": "x",
-                        "author_handle": handle,
-                        "author_name": author_name,
-                        "content": text[:500],
-                        "url": url,
-                        "external_id": f"x_{tweet_id}",
-                    })
-            except Exception as e:
-                logger.debug("fetch_pulse_x handle %s: %s", handle, e)
+                if items is None:
+                    rate_limited.append(futs[fut])
+                else:
+                    out.extend(items)
+        except FuturesTimeout:
+            logger.debug("fetch_pulse_x: %d handle(s) timed out", sum(1 for f in futs if not f.done()))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        if rate_limited:
+            logger.warning(
+                "fetch_pulse_x: timeline rate budget exhausted, skipped %d handle(s): %s",
+                len(rate_limited), ", ".join(rate_limited),
+            )
     except Exception as e:
         logger.warning("fetch_pulse_x: %s", e)
         return []
@@ -175,123 +416,270 @@ def _mock_pulse_x(handles, limit_per_user):
     return out
 
 
-def fetch_pulse_nostr(pubkeys, limit_total=20):
-    """Fetch kind:1 notes from Nostr pubkeys. Returns list of dicts (same shape as X)."""
-    out = []
-    now_ts = int(time.time())
-    seen_ids = set()
-    # Pull from major relays directly so this still works when third-party APIs are flaky.
-    relays = [
-        "wss://relay.damus.io",
-        "wss://relay.primal.net",
-        "wss://nos.lol",
-    ]
-    if not pubkeys:
-        pubkeys = []
-    tracked_suffixes = {pk[-16:] for pk in pubkeys if isinstance(pk, str) and pk.startswith("npub")}
-    btc_words = ("bitcoin", "btc", "sats", "lightning", "mempool", "hashrate", "mining")
+def _load_nostr_cursors():
+    global _NOSTR_CURSORS
+    if _NOSTR_CURSORS is None:
+        try:
+            with open(NOSTR_CURSOR_PATH, "r") as f:
+                _NOSTR_CURSORS = {k: int(v) for k, v in json.load(f).items()}
+        except FileNotFoundError:
+            _NOSTR_CURSORS = {}
+        except Exception as e:
+            logger.warning("nostr cursor load failed: %s", e)
+            _NOSTR_CURSORS = {}
+    return _NOSTR_CURSORS
+
 
-    for relay in relays:
-        ws = None
-        sub_id = f"pp-{int(time.time() * 1000)}"
+def _save_nostr_cursors(updates):
+    with _nostr_cursor_lock:
+        cursors = _load_nostr_cursors()
+        cursors.update(updates)
         try:
-            ws = websocket.create_connection(relay, timeout=6)
-            filt = {"kinds": [1], "limit": 35, "since": now_ts - 7200}
-            ws.send(json.dumps(["REQ", sub_id, filt], separators=(",", ":")))
-            ws.settimeout(1.2)
-            # Read a short burst so route stays snappy.
-            for _ in range(80):
-                raw = ws.recv()
-                if not raw:
-                    continue
-                msg = json.loads(raw)
-                if not isinstance(msg, list) or len(msg) < 2:
-                    continue
-                mtype = msg[0]
-                if mtype == "EOSE":
-                    break
-                if mtype != "EVENT" or len(msg) < 3:
-                    continue
-                event = msg[2] or {}
-                event_id = str(event.get("id") or "").strip()
-                content = (event.get("content") or "").strip()
-                pubkey = str(event.get("pubkey") or "").strip()
-                if not event_id or not content or event_id in seen_ids:
-                    continue
-                low = content.lower()
-                if not any(w in low for w in btc_words):
-                    continue
-                # If configured npubs exist, lightly bias toward matching pubkey suffix when possible.
-                if tracked_suffixes and pubkey and not any(pubkey.endswith(sfx) for sfx in tracked_suffixes):
-                    if len(out) >= (limit_total // 2):
-                        continue
-                seen_ids.add(event_id)
-                out.append({
-                    "platform": "nostr",
-                    "author_handle": pubkey[:16] + "…",
-                    "author_name": "Nostr",
-                    "content": content[:500],
-                    "url": f"https://primal.net/e/{event_id}",
-                    "external_id": f"nostr_{event_id}",
-                })
-                if len(out) >= limit_total:
-                    break
+            NOSTR_CURSOR_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = NOSTR_CURSOR_PATH.with_suffix(".tmp")
+            tmp.write_text(json.dumps(cursors), encoding="utf-8")
+            tmp.replace(NOSTR_CURSOR_PATH)
         except Exception as e:
-            logger.debug("fetch_pulse_nostr relay %s failed: %s", relay, e)
-        finally:
+            logger.warning("nostr cursor save failed: %s", e)
+
+
+def _fetch_relay_notes(relay, since, limit_total):
+    """Read one REQ burst from a pooled relay socket.
+
+    Returns a list of (pubkey, created_at, item) for bitcoin-related kind:1 notes,
+    newest first as the relay sent them.
+    """
+    found = []
+    seen_ids = set()
+    ws = None
+    healthy = False
+    # Unique per call so several REQs can share one pooled socket.
+    sub_id = f"pp-{int(time.time() * 1000)}-{threading.get_ident() % 10000}"
+    try:
+        ws = _relay_pool.acquire(relay)
+        filt = {"kinds": [1], "limit": 35, "since": since}
+        ws.settimeout(_RelayPool.CONNECT_TIMEOUT)
+        ws.send(json.dumps(["REQ", sub_id, filt], separators=(",", ":")))
+        # Read a short burst so route stays snappy: hard wall-clock budget per relay, and once
+        # events are flowing a shorter idle timeout (silence mid-stream means the relay is done).
+        deadline = time.monotonic() + NOSTR_RELAY_BUDGET
+        recv_timeout = 1.2
+        for _ in range(80):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ws.settimeout(min(recv_timeout, remaining))
+            raw = ws.recv()
+            if not raw:
+                continue
+            # Filter before parse: most kind:1 traffic is off-topic, so skip json.loads for
+            # EVENT frames that cannot contain a bitcoin keyword anywhere in the payload.
+            if '"EVENT"' in raw and not _BTC_WORDS_RE.search(raw):
+                continue
+            msg = _json_loads(raw)
+            if not isinstance(msg, list) or len(msg) < 2:
+                continue
+            if msg[1] != sub_id:
+                # Late frames from an earlier subscription on this pooled socket.
+                continue
+            recv_timeout = 0.5
+            mtype = msg[0]
+            if mtype == "EOSE":
+                break
+            if mtype != "EVENT" or len(msg) < 3:
+                continue
+            event = msg[2] or {}
             try:
-                if ws:
-                    ws.send(json.dumps(["CLOSE", sub_id]))
-                    ws.close()
+                created_at = int(event.get("created_at") or 0)
+            except (TypeError, ValueError):
+                created_at = 0
+            event_id = str(event.get("id") or "").strip()
+            content = (event.get("content") or "").strip()
+            pubkey = str(event.get("pubkey") or "").strip()
+            if not event_id or not content or event_id in seen_ids:
+                continue
+            if not _BTC_WORDS_RE.search(content):
+                continue
+            seen_ids.add(event_id)
+            found.append((pubkey, created_at, {
+                "platform": "nostr",
+                "author_handle": pubkey[:16] + "…",
+                "author_name": "Nostr",
+                "content": content[:500],
+                "url": f"https://primal.net/e/{event_id}",
+                "external_id": f"nostr_{event_id}",
+            }))
+            if len(found) >= limit_total:
+                break
+        healthy = True
+    except websocket.WebSocketTimeoutException:
+        # Quiet relay, not a dead one: the socket is still reusable.
+        healthy = True
+    except Exception as e:
+        logger.debug("fetch_pulse_nostr relay %s failed: %s", relay, e)
+    finally:
+        if ws is not None:
+            try:
+                # Free the server-side subscription but keep the socket for the next cycle.
+                ws.send(json.dumps(["CLOSE", sub_id]))
             except Exception:
-                pass
-        if len(out) >= limit_total:
-            break
-    return out[:limit_total]
+                healthy = False
+            if healthy:
+                _relay_pool.release(relay, ws)
+            else:
+                _relay_pool.discard(relay, ws)
+    return found
+
+
+def fetch_pulse_nostr(pubkeys, limit_total=20, cursor_key=None, cursor_updates=None):
+    """Fetch kind:1 notes from Nostr pubkeys. Returns list of dicts (same shape as X).
+
+    Relays are read concurrently, so wall-clock is the slowest relay rather than the sum.
+    With cursor_key, each relay's NIP-01 ``since`` resumes from the cursor saved under that
+    key instead of replaying the full two-hour window. New cursor values are written into
+    the cursor_updates dict, never saved here: the caller passes them to
+    _save_nostr_cursors once the returned notes are safely stored.
+    """
+    now_ts = int(time.time())
+    window_start = now_ts - 7200
+    cursors = {}
+    if cursor_key:
+        with _nostr_cursor_lock:
+            cursors = dict(_load_nostr_cursors())
+    if not pubkeys:
+        pubkeys = []
+    tracked_suffixes = {pk[-16:] for pk in pubkeys if isinstance(pk, str) and pk.startswith("npub")}
+
+    def _since(relay):
+        ckey = f"{cursor_key}|{relay}"
+        if cursor_key and ckey in cursors:
+            return max(window_start, cursors[ckey] + 1)
+        return window_start
+
+    with ThreadPoolExecutor(max_workers=len(NOSTR_RELAYS)) as pool:
+        results = list(pool.map(lambda r: _fetch_relay_notes(r, _since(r), limit_total), NOSTR_RELAYS))
+
+    # Merge in relay priority order so output matches the old sequential walk.
+    out = []
+    seen_ids = set()
+    for relay, found in zip(NOSTR_RELAYS, results):
+        newest_kept = 0
+        oldest_dropped = None
+        if len(found) >= limit_total:
+            # The relay read stopped at limit_total, so older matching notes may not have been
+            # received at all; keep the cursor behind the oldest one we did see.
+            oldest_dropped = min(created_at for _, created_at, _ in found)
+        for pubkey, created_at, item in found:
+            if item["external_id"] in seen_ids:
+                # Already returned via an earlier relay.
+                newest_kept = max(newest_kept, created_at)
+                continue
+            # If configured npubs exist, lightly bias toward matching pubkey suffix when possible.
+            dropped = len(out) >= limit_total or (
+                tracked_suffixes and pubkey and len(out) >= (limit_total // 2)
+                and not any(pubkey.endswith(sfx) for sfx in tracked_suffixes)
+            )
+            if dropped:
+                oldest_dropped = created_at if oldest_dropped is None else min(oldest_dropped, created_at)
+                continue
+            seen_ids.add(item["external_id"])
+            out.append(item)
+            newest_kept = max(newest_kept, created_at)
+        if cursor_key and cursor_updates is not None and newest_kept:
+            # Advance only to the newest note actually returned, and stay behind any note that
+            # was cut by the limit so the next call fetches it again.
+            advance = newest_kept if oldest_dropped is None else min(newest_kept, oldest_dropped - 1)
+            ckey = f"{cursor_key}|{relay}"
+            advance = min(advance, now_ts)
+            if advance > cursors.get(ckey, 0):
+                cursor_updates[ckey] = advance
+    return out
+
+
+_YT_API = None
+# The discovery client is not thread-safe; this lock guards both building it and every call on it.
+_yt_lock = threading.Lock()
+
+
+def _youtube_api():
+    """Module-wide YouTube Data API client, built on first use. Caller must hold _yt_lock.
+
+    Building the discovery client is expensive and its httplib2 transport keeps the
+    TLS connection alive between calls, so one instance serves every ingest.
+    """
+    global _YT_API
+    if _YT_API is None:
+        from services.youtube_service import YouTubeService
+        yt = YouTubeService()
+        _YT_API = getattr(yt, "youtube", None) or (getattr(yt, "get_api", None) and yt.get_api()) or None
+    return _YT_API
 
 
 def fetch_pulse_youtube(channel_ids, limit_per_channel=2):
     """Fetch latest uploads from YouTube channel IDs. Returns list of dicts."""
     if not channel_ids:
         return []
-    out = []
     try:
-        from services.youtube_service import YouTubeService
-        yt = YouTubeService()
-        api = getattr(yt, "youtube", None) or (getattr(yt, "get_api", None) and yt.get_api())
-        if not api:
-            return []
-        for cid in channel_ids[:15]:
-            try:
-                req = api.search().list(
-                    part="snippet",
-                    channelId=cid,
-                    type="video",
-                    order="date",
-                    maxResults=limit_per_channel,
-                )
-                res = req.execute()
-                for item in res.get("items", []):
-                    sid = item["id"].get("videoId")
-                    if not sid:
-                        continue
-                    sn = item.get("snippet", {})
-                    title = sn.get("title", "Video")
-                    channel = sn.get("channelTitle", "YouTube")
-                    external_id = f"yt_{sid}"
-                    out.append({
-                        "platform": "youtube",
-                        "author_handle": channel,
-                        "author_name": channel,
-                        "content": title[:300],
-                        "url": f"https://www.youtube.com/watch?v={sid}",
-                        "external_id": external_id,
-                    })
-            except Exception as e:
-                logger.debug("fetch_pulse_youtube channel %s: %s", cid, e)
+        with _yt_lock:
+            api = _youtube_api()
+            if not api:
+                return []
+            return _fetch_youtube_uploads(api, channel_ids, limit_per_channel)
     except Exception as e:
         logger.warning("fetch_pulse_youtube: %s", e)
         return []
+
+
+def _fetch_youtube_uploads(api, channel_ids, limit_per_channel):
+    out = []
+    # One channels.list call resolves every uploads playlist (1 quota unit vs 100 per search.list).
+    ids = [c for c in channel_ids[:50] if c]
+    if not ids:
+        return []
+    if not _YT_BUCKET.acquire(timeout=0):
+        logger.warning("fetch_pulse_youtube: daily quota budget exhausted")
+        return []
+    ch_res = api.channels().list(part="contentDetails", id=",".join(ids), maxResults=50).execute()
+    playlists = []
+    for ch in ch_res.get("items", []):
+        pl = ((ch.get("contentDetails") or {}).get("relatedPlaylists") or {}).get("uploads")
+        if pl:
+            playlists.append(pl)
+
+    def _collect(request_id, res, exc):
+        if exc is not None:
+            logger.debug("fetch_pulse_youtube playlist %s: %s", request_id, exc)
+            return
+        for item in (res or {}).get("items", []):
+            sn = item.get("snippet", {})
+            sid = (sn.get("resourceId") or {}).get("videoId")
+            if not sid:
+                continue
+            title = sn.get("title", "Video")
+            channel = sn.get("channelTitle", "YouTube")
+            external_id = f"yt_{sid}"
+            out.append({
+                "platform": "youtube",
+                "author_handle": channel,
+                "author_name": channel,
+                "content": title[:300],
+                "url": f"https://www.youtube.com/watch?v={sid}",
+                "external_id": external_id,
+            })
+
+    # googleapiclient service objects are not thread-safe, so fan out via a batch HTTP request instead.
+    batch = api.new_batch_http_request(callback=_collect)
+    for pl in playlists:
+        batch.add(
+            api.playlistItems().list(part="snippet", playlistId=pl, maxResults=limit_per_channel),
+            request_id=pl,
+        )
+    if not playlists:
+        return out
+    if not _YT_BUCKET.acquire(len(playlists), timeout=0):
+        logger.warning("fetch_pulse_youtube: daily quota budget exhausted, skipped %d playlist(s)", len(playlists))
+        return out
+    batch.execute()
     return out
 
 
@@ -310,80 +698,152 @@ def _mock_pulse_youtube(channel_ids, limit_per_channel):
     return out
 
 
+def _insert_ignore(db, model, rows, key):
+    """INSERT ... ON CONFLICT (key) DO NOTHING for Postgres/SQLite; None on other dialects."""
+    dialect = db.engine.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert(model).values(rows).on_conflict_do_nothing(index_elements=[key])
+
+
 def ingest_pulse():
     """Fetch from X, Nostr, YouTube and insert into KOLPulseItem. Dedupe by external_id. Returns count inserted."""
     kol = load_kol_list()
     all_items = []
-    all_items.extend(fetch_pulse_x(kol.get("x_handles", []), limit_per_user=2))
-    all_items.extend(fetch_pulse_nostr(kol.get("nostr_pubkeys", []), limit_total=10))
-    all_items.extend(fetch_pulse_youtube(kol.get("youtube_channel_ids", []), limit_per_channel=1))
+    nostr_cursors = {}
+    # The three sources are independent and network-bound; overlap them so ingest takes max() not sum().
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futs = {
+            pool.submit(fetch_pulse_x, kol.get("x_handles", []), limit_per_user=2): "x",
+            pool.submit(
+                fetch_pulse_nostr, kol.get("nostr_pubkeys", []), limit_total=10,
+                cursor_key="ingest", cursor_updates=nostr_cursors,
+            ): "nostr",
+            pool.submit(fetch_pulse_youtube, kol.get("youtube_channel_ids", []), limit_per_channel=1): "youtube",
+        }
+        for fut in as_completed(futs):
+            try:
+                all_items.extend(fut.result())
+            except Exception as e:
+                logger.warning("ingest_pulse %s fetch failed: %s", futs[fut], e)
     db = _db()
     models = _models()
+    rows = []
+    for item in all_items:
+        # platform/author_handle/external_id identify the row; author_name and url are optional
+        # in fetcher output and fall back / get validated below.
+        platform = item.get("platform")
+        author_handle = item.get("author_handle")
+        external_id = item.get("external_id")
+        if not (platform and author_handle and external_id):
+            continue
+        content = item.get("content")
+        url = item.get("url")
+        if _is_placeholder_item(item):
+            continue
+        if not _valid_url(url):
+            continue
+        if not (content or "").strip():
+            continue
+        rows.append({
+            "platform": platform,
+            "author_handle": author_handle,
+            "author_name": item.get("author_name") or author_handle,
+            "content": content,
+            "url": url,
+            "external_id": external_id,
+            "raw_json": _json_dumps(item),
+        })
+    if not rows:
+        if nostr_cursors:
+            _save_nostr_cursors(nostr_cursors)
+        return 0
     inserted = 0
     try:
-        for item in all_items:
-            if _is_placeholder_item(item):
-                continue
-            if not _valid_url(item.get("url")):
-                continue
-            if not (item.get("content") or "").strip():
-                continue
-            existing = models.KOLPulseItem.query.filter_by(external_id=item["external_id"]).first()
-            if existing:
-                continue
-            row = models.KOLPulseItem(
-                platform=item["platform"],
-                author_handle=item["author_handle"],
-                author_name=item.get("author_name") or item["author_handle"],
-                content=item.get("content"),
-                url=item.get("url"),
-                external_id=item["external_id"],
-                raw_json=json.dumps(item) if item else None,
-            )
-            db.session.add(row)
-            inserted += 1
+        stmt = _insert_ignore(db, models.KOLPulseItem, rows, "external_id")
+        if stmt is not None:
+            # Unique external_id dedupes atomically in the DB, so concurrent ingests cannot collide.
+            inserted = db.session.execute(stmt).rowcount or 0
+        else:
+            # One IN lookup for the whole batch instead of a SELECT per item.
+            existing = {
+                eid for (eid,) in db.session.query(models.KOLPulseItem.external_id)
+                .filter(models.KOLPulseItem.external_id.in_([r["external_id"] for r in rows]))
+                .all()
+            }
+            new_rows = []
+            for row in rows:
+                if row["external_id"] in existing:
+                    continue
+                existing.add(row["external_id"])
+                new_rows.append(row)
+            # Plain mappings go straight to an executemany INSERT, skipping KOLPulseItem.__init__.
+            db.session.bulk_insert_mappings(models.KOLPulseItem, new_rows)
+            inserted = len(new_rows)
         db.session.commit()
     except Exception as e:
         logger.exception("ingest_pulse: %s", e)
         db.session.rollback()
+        # Cursors stay put so the next ingest fetches the same notes again.
+        return 0
+    if nostr_cursors:
+        _save_nostr_cursors(nostr_cursors)
     return inserted
 
 
 def get_pulse_feed(limit=80):
     """Return latest pulse items for Command Log. Newest first, no placeholders."""
+    db = _db()
     models = _models()
-    rows = (
-        models.KOLPulseItem.query
-        .order_by(models.KOLPulseItem.created_at.desc())
+    # Column-only Core select streamed in chunks: no ORM hydration or identity-map churn.
+    item_cls = models.KOLPulseItem
+    stmt = (
+        db.select(
+            item_cls.id,
+            item_cls.platform,
+            item_cls.author_handle,
+            item_cls.author_name,
+            db.func.substr(item_cls.content, 1, 200).label("content"),
+            item_cls.url,
+            item_cls.external_id,
+            item_cls.created_at,
+        )
+        .order_by(item_cls.created_at.desc())
         .limit(max(limit * 2, 120))
-        .all()
     )
 
     feed = []
     seen_urls = set()
-    for r in rows:
-        item = {
-            "id": r.id,
-            "platform": r.platform,
-            "author_handle": r.author_handle,
-            "author_name": r.author_name or r.author_handle,
-            "content": (r.content or "")[:200],
-            "url": r.url,
-            "external_id": r.external_id,
-            "created_at": r.created_at.isoformat() if r.created_at else None,
-        }
-        if _is_placeholder_item(item):
-            continue
-        if not _valid_url(item.get("url")):
-            continue
-        if not item.get("content"):
-            continue
-        if item["url"] in seen_urls:
-            continue
-        seen_urls.add(item["url"])
-        feed.append(item)
-        if len(feed) >= limit:
-            return feed
+    with db.session.execute(stmt).yield_per(200) as rows:
+        for r in rows:
+            item = {
+                "id": r.id,
+                "platform": r.platform,
+                "author_handle": r.author_handle,
+                "author_name": r.author_name or r.author_handle,
+                "content": r.content or "",
+                "url": r.url,
+                "external_id": r.external_id,
+                "created_at": r.created_at.isoformat() if r.created_at else None,
+            }
+            if _is_placeholder_item(item):
+                continue
+            if not _valid_url(item.get("url")):
+                continue
+            if not item.get("content"):
+                continue
+            if item["url"] in seen_urls:
+                continue
+            seen_urls.add(item["url"])
+            feed.append(item)
+            if len(feed) >= limit:
+                break
+    if len(feed) >= limit:
+        return feed
 
     # Prefer real-time verified signal pipeline (X + Nostr) over synthetic/fallback content.
     try:
@@ -400,12 +860,24 @@ def get_pulse_feed(limit=80):
 
     # Fallback: if external APIs are unavailable, show real curated posts instead of fake placeholders.
     try:
-        post_rows = (
-            models.CuratedPost.query
-            .order_by(models.CuratedPost.submitted_at.desc())
+        post = models.CuratedPost
+        curator = models.ValueCreator
+        # Curator name comes from the same query via an outer join, not a lazy load per row.
+        post_rows = db.session.execute(
+            db.select(
+                post.id,
+                post.platform,
+                post.original_url,
+                post.title,
+                # Generous prefix: the preview is stripped before its 220-char cut below.
+                db.func.substr(post.content_preview, 1, 1000).label("content_preview"),
+                post.submitted_at,
+                curator.display_name.label("curator_name"),
+            )
+            .outerjoin(curator, curator.id == post.curator_id)
+            .order_by(post.submitted_at.desc())
             .limit(max(limit * 2, 120))
-            .all()
-        )
+        ).all()
         for p in post_rows:
             if not _valid_url(p.original_url):
                 continue
@@ -422,11 +894,7 @@ def get_pulse_feed(limit=80):
             if p.original_url in seen_urls:
                 continue
             seen_urls.add(p.original_url)
-            curator_name = None
-            try:
-                curator_name = p.curator.display_name if p.curator else None
-            except Exception:
-                curator_name = None
+            curator_name = p.curator_name
             feed.append({
                 "id": p.id,
                 "platform": p.platform or "web",
@@ -444,30 +912,32 @@ def get_pulse_feed(limit=80):
     return feed[:limit]
 
 
+# 25 * log10(1 + ratio) == log1p(ratio) * (25 / ln 10)
+_MARKET_PULSE_LOG_SCALE = 25 / math.log(10)
+
+
 def compute_market_pulse():
     """
     Economic Sentiment Index: Zap-to-Post ratio (money flow = signal).
     Returns dict: { value 0-100, label, zap_volume_24h, posts_with_zaps_24h, ratio }.
     """
-    from datetime import datetime, timedelta
     db = _db()
     models = _models()
     since = datetime.utcnow() - timedelta(hours=24)
-    zap_volume = db.session.query(
-        db.func.coalesce(db.func.sum(models.ZapEvent.amount_sats), 0)
-    ).filter(models.ZapEvent.created_at >= since).scalar() or 0
-    posts_with_zaps = db.session.query(
-        db.func.count(db.distinct(models.ZapEvent.post_id))
-    ).filter(models.ZapEvent.created_at >= since).scalar() or 0
-    total_posts = models.CuratedPost.query.count() or 1
+    # Volume, distinct zapped posts and the sats/post ratio come back in a single round trip.
+    zap_sum = db.func.coalesce(db.func.sum(models.ZapEvent.amount_sats), 0)
+    zap_posts = db.func.count(db.distinct(models.ZapEvent.post_id))
+    row = db.session.query(
+        zap_sum,
+        zap_posts,
+        db.case((zap_posts > 0, db.cast(zap_sum, db.Float) / zap_posts), else_=0.0),
+    ).filter(models.ZapEvent.created_at >= since).one()
+    zap_volume = row[0] or 0
+    posts_with_zaps = row[1] or 0
     # Ratio: high zap volume + concentrated on few posts = high signal; spread thin = noise
-    if posts_with_zaps > 0:
-        ratio = float(zap_volume) / posts_with_zaps
-    else:
-        ratio = 0.0
+    ratio = float(row[2] or 0.0)
     # Normalize to 0-100: e.g. 1000 sats/post = 10, 10k = 50, 50k+ = 100
-    import math
-    value = min(100, max(0, math.log10(ratio + 1) * 25))
+    value = min(100, max(0, math.log1p(ratio) * _MARKET_PULSE_LOG_SCALE))
     if value < 25:
         label = "Noise"
     elif value < 50:
@@ -0,0 +1,37 @@
+"""Shared rate limiting primitives for outbound API clients."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to shape outbound API calls under provider rate limits."""
+
+    def __init__(self, capacity, refill_per_sec):
+        self.capacity = float(capacity)
+        self.refill_per_sec = float(refill_per_sec)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens):
+        """Take tokens if available; otherwise return seconds until they will be."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_sec)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.refill_per_sec
+
+    def acquire(self, tokens=1, timeout=None):
+        """Block until tokens are available. Returns False if that would exceed timeout seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take(tokens)
+            if not wait:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
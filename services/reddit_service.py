@@ -1,46 +1,200 @@
 import os
+import heapq
+import json
 import logging
+import re
+import threading
+import time
 import praw
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from typing import List, Dict
 
+from services.rate_limiter import TokenBucket
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Listing/comment payloads are large nested dicts; orjson parses them several times faster.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Trending listings move slowly; short-lived in-process cache saves rate-limit budget across callers.
+_RESPONSE_CACHE = {}  # key -> (expires_at, value)
+_RESPONSE_CACHE_MAX = 256
+_response_cache_lock = threading.Lock()
+TRENDING_CACHE_TTL = 120
+POST_DETAILS_CACHE_TTL = 300
+
+# Reddit allows ~60 requests/minute per client; shared by PRAW and the public JSON endpoints
+# so concurrent workers queue up instead of tripping 429s.
+_REDDIT_BUCKET = TokenBucket(60, 1)
+REDDIT_RATE_WAIT = 10  # seconds a caller will wait for a request slot
+CONNECTION_OK_TTL = 60  # health checks reuse a successful probe for this long
+
+DEFAULT_USER_AGENT = "ProtocolPulse/1.0 (reddit trend monitor)"
+
+
+def _cache_get(key):
+    with _response_cache_lock:
+        hit = _RESPONSE_CACHE.get(key)
+        if hit and hit[0] > time.monotonic():
+            return hit[1]
+        _RESPONSE_CACHE.pop(key, None)
+    return None
+
+
+def _cache_set(key, value, ttl):
+    with _response_cache_lock:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+            now = time.monotonic()
+            for k in [k for k, (exp, _) in _RESPONSE_CACHE.items() if exp <= now]:
+                del _RESPONSE_CACHE[k]
+            while len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+                _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+        _RESPONSE_CACHE[key] = (time.monotonic() + ttl, value)
+
+
+def cache_clear():
+    """Drop all cached Reddit responses."""
+    with _response_cache_lock:
+        _RESPONSE_CACHE.clear()
+        _VALIDATORS.clear()
+
+
+# Past the TTL, listings are revalidated with If-None-Match/If-Modified-Since; a 304 reuses the
+# last payload instead of re-downloading it.
+_VALIDATORS = {}  # (url, params) -> (etag, last_modified, data)
+
+
+# Bitcoin and DeFi focused subreddits
+CRYPTO_SUBREDDITS = (
+    'bitcoin',
+    'defi',
+    'cryptocurrency',
+    'bitcoinbeginners',
+    'bitcoindiscussion',
+    'lightningnetwork',
+    'decentralizedfinance',
+    'ethfinance',
+    'cryptomarkets',
+    'bitcointech',
+)
+BITCOIN_SUBREDDITS = ('bitcoin', 'bitcoinbeginners', 'bitcoindiscussion', 'lightningnetwork')
+DEFI_SUBREDDITS = ('defi', 'decentralizedfinance', 'ethfinance')
+# Multireddit paths for the PRAW listings (r/a+b+c).
+_BITCOIN_MULTI = '+'.join(BITCOIN_SUBREDDITS)
+_DEFI_MULTI = '+'.join(DEFI_SUBREDDITS)
+
+# Keywords that indicate relevance to Web3/crypto topics.
+_RELEVANT_KEYWORDS = (
+    'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'cryptocurrency',
+    'blockchain', 'web3', 'defi', 'nft', 'dao', 'smart contract',
+    'mining', 'staking', 'yield farming', 'dapp', 'metaverse',
+    'privacy', 'decentralized', 'protocol', 'token', 'coin',
+    'regulation', 'sec', 'cbdc', 'lightning network', 'layer 2'
+)
+_RELEVANT_RE = re.compile('|'.join(map(re.escape, _RELEVANT_KEYWORDS)), re.IGNORECASE)
+
+# (title keyword pattern, article angle) in priority order. Keywords are anchored at a word
+# start so plurals/inflections still match ("prices", "hacked") while e.g. "sec" no longer
+# fires on "security" or "second".
+_ANGLE_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), angle)
+    for pattern, angle in (
+        (r"\b(?:price|surge|rally|pump)", "Market Analysis: Price Movement Deep Dive"),
+        (r"\b(?:adoption|institutional|company)", "Adoption News: Industry Impact Analysis"),
+        (r"\b(?:technical|upgrade|update|protocol)", "Technical Analysis: Technology Advancement"),
+        (r"\b(?:regulation|legal|sec\b|government)", "Regulatory Update: Policy Impact Assessment"),
+        (r"\b(?:hack|security|exploit)", "Security Alert: Risk Analysis and Prevention"),
+        (r"\b(?:defi|yield|liquidity|protocol)", "DeFi Deep Dive: Protocol Analysis"),
+    )
+)
+_DEFAULT_ANGLE = "Community Spotlight: Trending Discussion Analysis"
+
+
+def _unique_posts(posts):
+    """Yield raw post dicts, skipping repeats and cross-posts of a post already seen (first wins)."""
+    seen = set()
+    for post in posts:
+        key = post.get('crosspost_parent') or post.get('name') or post.get('id')
+        if key:
+            if key in seen:
+                continue
+            seen.add(key)
+        yield post
+
+
+def _post_score(post):
+    return post.get('score', 0)
+
+
+def _engagement(post):
+    return post['score'] + post['num_comments'] * 2
+
+
 class RedditService:
     def __init__(self):
-        self.reddit = None
-        client_id = os.environ.get('REDDIT_CLIENT_ID')
-        client_secret = os.environ.get('REDDIT_CLIENT_SECRET')
-        user_agent = os.environ.get('REDDIT_USER_AGENT')
-        if not (client_id and client_secret and user_agent):
+        self.crypto_subreddits = CRYPTO_SUBREDDITS
+        self.base_url = "https://www.reddit.com"
+        self._subreddits = {}  # name -> PRAW Subreddit handle
+        self._last_ok_ts = 0.0
+        self._credentials = (
+            os.environ.get('REDDIT_CLIENT_ID'),
+            os.environ.get('REDDIT_CLIENT_SECRET'),
+            os.environ.get('REDDIT_USER_AGENT'),
+        )
+        # One keep-alive session for the public JSON endpoints so TLS is negotiated once.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=['GET'], respect_retry_after_header=True),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': self._credentials[2] or DEFAULT_USER_AGENT,
+            'Accept-Encoding': 'gzip',
+        })
+        if not all(self._credentials):
             logging.warning("Reddit PRAW disabled: missing REDDIT_CLIENT_ID/REDDIT_CLIENT_SECRET/REDDIT_USER_AGENT")
-            self.use_api = False
-            self.base_url = "https://www.reddit.com"
-            return
+
+    @cached_property
+    def reddit(self):
+        """PRAW client, built on first use so instances that never touch the API skip the setup."""
+        client_id, client_secret, user_agent = self._credentials
+        if not (client_id and client_secret and user_agent):
+            return None
         try:
-            self.reddit = praw.Reddit(
+            reddit = praw.Reddit(
                 client_id=client_id,
                 client_secret=client_secret,
                 user_agent=user_agent
             )
             logging.info("Reddit PRAW service initialized successfully")
+            return reddit
         except Exception as e:
             logging.warning("Failed to initialize PRAW; reddit features degraded: %s", e)
-        self.use_api = bool(self.reddit)
-        self.base_url = "https://www.reddit.com"
+            return None
 
-        # Bitcoin and DeFi focused subreddits
-        self.crypto_subreddits = [
-            'bitcoin',
-            'defi', 
-            'cryptocurrency',
-            'bitcoinbeginners',
-            'bitcoindiscussion',
-            'lightningnetwork',
-            'decentralizedfinance',
-            'ethfinance',
-            'cryptomarkets',
-            'bitcointech'
-        ]
+    @property
+    def use_api(self):
+        return self.reddit is not None
     
+    def _subreddit(self, name):
+        """Reuse one PRAW Subreddit handle per name across polling cycles."""
+        sub = self._subreddits.get(name)
+        if sub is None:
+            sub = self._subreddits[name] = self.reddit.subreddit(name)
+        return sub
+
     def post_to_reddit(self, subreddit_name: str, title: str, url: str) -> Dict:
         """Post a link to Reddit using PRAW"""
         result = {"success": False, "post_url": None, "errors": []}
@@ -49,8 +203,12 @@ class RedditService:
             result["errors"].append("Reddit API not available")
             return result
             
+        if not self._acquire_slot(f"post to r/{subreddit_name}"):
+            result["errors"].append("Reddit rate limit reached, try again shortly")
+            return result
+            
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
+            subreddit = self._subreddit(subreddit_name)
             
             # Submit the link post
             submission = subreddit.submit(title=title, url=url)
@@ -70,23 +228,37 @@ class RedditService:
     def get_trending_posts(self, subreddit_name: str, limit: int = 10) -> List[Dict]:
         if not self.reddit:
             return []
+        cache_key = ('praw_hot', subreddit_name, limit)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+        if not self._acquire_slot(f"r/{subreddit_name} hot"):
+            return []
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
+            subreddit = self._subreddit(subreddit_name)
             posts = []
-            for submission in subreddit.hot(limit=limit):
-                if submission.stickied:
+            # Listing submissions arrive fully populated; read the instance dict directly
+            # rather than going through PRAW's lazy attribute protocol per field.
+            listing = (vars(submission) for submission in subreddit.hot(limit=limit))
+            # Multireddits surface the same story cross-posted to several subs; keep the first.
+            for data in _unique_posts(listing):
+                if data.get('stickied'):
                     continue
+                author = data.get('author')
                 posts.append({
-                    'title': submission.title,
-                    'url': submission.url,
-                    'score': submission.score,
-                    'num_comments': submission.num_comments,
-                    'created_utc': datetime.fromtimestamp(submission.created_utc),
-                    'selftext': submission.selftext,
-                    'author': str(submission.author) if submission.author else '[deleted]',
-                    'permalink': f"https://reddit.com{submission.permalink}"
+                    'id': data.get('id'),
+                    'title': data.get('title', ''),
+                    'url': data.get('url', ''),
+                    'score': data.get('score', 0),
+                    'num_comments': data.get('num_comments', 0),
+                    'created_utc': data.get('created_utc', 0),
+                    'selftext': data.get('selftext', ''),
+                    'author': author.name if author else '[deleted]',
+                    'permalink': f"https://reddit.com{data.get('permalink', '')}",
+                    'subreddit': data['subreddit'].display_name if data.get('subreddit') else subreddit_name
                 })
-            return posts
+            _cache_set(cache_key, posts, TRENDING_CACHE_TTL)
+            return list(posts)
         except Exception as e:
             logging.error(f"Error fetching posts from r/{subreddit_name}: {e}")
             return []
@@ -99,66 +271,113 @@ class RedditService:
         time_period: 'hour', 'day', 'week', 'month', 'year', 'all'
         """
         trending_posts = []
-        
-        for subreddit in subreddits:
-            try:
-                url = f"{self.base_url}/r/{subreddit}/hot.json"
-                params = {
-                    'limit': limit,
-                    't': time_period
-                }
-                
-                response = requests.get(url, headers=self.headers, params=params, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    posts = data.get('data', {}).get('children', [])
-                    
-                    for post_data in posts:
-                        post = post_data.get('data', {})
-                        
-                        # Filter for relevant content
-                        if self._is_relevant_post(post):
-                            trending_posts.append({
-                                'title': post.get('title', ''),
-                                'selftext': post.get('selftext', ''),
-                                'url': post.get('url', ''),
-                                'subreddit': post.get('subreddit', ''),
-                                'score': post.get('score', 0),
-                                'num_comments': post.get('num_comments', 0),
-                                'created_utc': post.get('created_utc', 0),
-                                'permalink': f"{self.base_url}{post.get('permalink', '')}",
-                                'author': post.get('author', 'Unknown')
-                            })
-                
-                else:
-                    logging.warning(f"Failed to fetch from r/{subreddit}: {response.status_code}")
-                    
-            except Exception as e:
-                logging.error(f"Error fetching from r/{subreddit}: {str(e)}")
-                continue
-        
-        # Sort by score (popularity) and return top posts
-        trending_posts.sort(key=lambda x: x['score'], reverse=True)
-        return trending_posts[:limit * len(subreddits)]
+        if not subreddits:
+            return trending_posts
+        cache_key = ('hot', tuple(subreddits), limit, time_period)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # One multireddit listing (r/a+b+c) instead of a round trip per subreddit.
+        combined = '+'.join(subreddits)
+        if not self._acquire_slot(f"r/{combined} hot.json"):
+            return trending_posts
+        try:
+            url = f"{self.base_url}/r/{combined}/hot.json"
+            params = {
+                'limit': min(100, limit * len(subreddits)),
+                't': time_period
+            }
+
+            status, data = self._get_json(url, params)
+
+            if status == 200:
+                posts = data.get('data', {}).get('children', [])
+
+                # Filter for relevant content and keep the top posts by score (popularity)
+                # in one bounded-heap pass; output dicts are only built for the survivors.
+                relevant = (
+                    post for post in _unique_posts(post_data.get('data', {}) for post_data in posts)
+                    if self._is_relevant_post(post)
+                )
+                for post in heapq.nlargest(limit * len(subreddits), relevant, key=_post_score):
+                    trending_posts.append({
+                        'id': post.get('id'),
+                        'title': post.get('title', ''),
+                        'selftext': post.get('selftext', ''),
+                        'url': post.get('url', ''),
+                        'subreddit': post.get('subreddit', ''),
+                        'score': post.get('score', 0),
+                        'num_comments': post.get('num_comments', 0),
+                        'created_utc': post.get('created_utc', 0),
+                        'permalink': f"{self.base_url}{post.get('permalink', '')}",
+                        'author': post.get('author', 'Unknown')
+                    })
+
+            else:
+                logging.warning(f"Failed to fetch from r/{combined}: {status}")
+
+        except Exception as e:
+            logging.error(f"Error fetching from r/{combined}: {str(e)}")
+
+        if trending_posts:
+            _cache_set(cache_key, trending_posts, TRENDING_CACHE_TTL)
+        return list(trending_posts)
     
+    def get_trending_topics_by_subreddit(self, subreddits, limit=10, time_period='day'):
+        """
+        Per-subreddit trending lists when each sub needs its own top-N (a multireddit
+        listing ranks them together). Subreddits are fetched concurrently.
+        Returns {subreddit: [posts]} in input order.
+        """
+        if not subreddits:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(subreddits))) as pool:
+            results = pool.map(
+                lambda sub: self.get_trending_topics([sub], limit=limit, time_period=time_period),
+                subreddits,
+            )
+            return dict(zip(subreddits, results))
+
+    def _get_json(self, url, params=None, timeout=10):
+        """Conditional GET of a Reddit JSON endpoint. Returns (status, data); a 304 yields (200, cached data)."""
+        key = (url, tuple(sorted((params or {}).items())))
+        with _response_cache_lock:
+            prior = _VALIDATORS.get(key)
+        headers = {}
+        if prior:
+            if prior[0]:
+                headers['If-None-Match'] = prior[0]
+            if prior[1]:
+                headers['If-Modified-Since'] = prior[1]
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304 and prior:
+            return 200, prior[2]
+        if response.status_code != 200:
+            return response.status_code, None
+        data = _json_loads(response.content)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            with _response_cache_lock:
+                if len(_VALIDATORS) >= _RESPONSE_CACHE_MAX:
+                    _VALIDATORS.pop(next(iter(_VALIDATORS)))
+                _VALIDATORS[key] = (etag, last_modified, data)
+        return 200, data
+
+    def _acquire_slot(self, what):
+        if _REDDIT_BUCKET.acquire(timeout=REDDIT_RATE_WAIT):
+            return True
+        logging.warning(f"Reddit rate limit: skipping {what}")
+        return False
+
     def _is_relevant_post(self, post):
         """Filter posts for relevance to Web3/crypto topics"""
-        title = post.get('title', '').lower()
-        selftext = post.get('selftext', '').lower()
-        
-        # Keywords that indicate relevance
-        relevant_keywords = [
-            'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'cryptocurrency', 
-            'blockchain', 'web3', 'defi', 'nft', 'dao', 'smart contract',
-            'mining', 'staking', 'yield farming', 'dapp', 'metaverse',
-            'privacy', 'decentralized', 'protocol', 'token', 'coin',
-            'regulation', 'sec', 'cbdc', 'lightning network', 'layer 2'
-        ]
-        
         # Check if any relevant keywords are in title or text
-        content = f"{title} {selftext}"
-        return any(keyword in content for keyword in relevant_keywords)
+        return bool(
+            _RELEVANT_RE.search(post.get('title') or '')
+            or _RELEVANT_RE.search(post.get('selftext') or '')
+        )
     
     def get_post_details(self, post_url):
         """Get detailed information about a specific Reddit post"""
@@ -168,11 +387,19 @@ class RedditService:
                 json_url = post_url.rstrip('/') + '.json'
             else:
                 return None
+            cache_key = ('details', json_url)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+            if not self._acquire_slot("post details"):
+                return None
             
-            response = requests.get(json_url, headers=self.headers, timeout=10)
+            # Only the top 5 top-level comments are used; have Reddit trim the comment
+            # tree server-side instead of downloading and parsing the whole thread.
+            params = {'limit': 5, 'depth': 1}
+            status, data = self._get_json(json_url, params)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 if isinstance(data, list) and len(data) > 0:
                     post_data = data[0].get('data', {}).get('children', [])
                     if post_data:
@@ -191,7 +418,7 @@ class RedditService:
                                         'author': comment_info.get('author', 'Unknown')
                                     })
                         
-                        return {
+                        details = {
                             'title': post.get('title', ''),
                             'selftext': post.get('selftext', ''),
                             'url': post.get('url', ''),
@@ -200,6 +427,8 @@ class RedditService:
                             'comments': comments,
                             'created_utc': post.get('created_utc', 0)
                         }
+                        _cache_set(cache_key, details, POST_DETAILS_CACHE_TTL)
+                        return details
             
             return None
             
@@ -218,11 +447,16 @@ class RedditService:
                 'limit': limit,
                 't': 'week'  # Posts from the last week
             }
+            cache_key = ('search', subreddit, tuple(sorted(params.items())))
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return list(cached)
+            if not self._acquire_slot(f"r/{subreddit} search"):
+                return []
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            status, data = self._get_json(url, params)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 posts = data.get('data', {}).get('children', [])
                 
                 search_results = []
@@ -237,7 +471,8 @@ class RedditService:
                         'created_utc': post.get('created_utc', 0)
                     })
                 
-                return search_results
+                _cache_set(cache_key, search_results, TRENDING_CACHE_TTL)
+                return list(search_results)
             
             return []
             
@@ -248,16 +483,11 @@ class RedditService:
     def get_bitcoin_trending_topics(self, limit: int = 20) -> List[Dict]:
         """Get trending Bitcoin-related topics using PRAW"""
         if self.use_api:
-            bitcoin_subreddits = ['bitcoin', 'bitcoinbeginners', 'bitcoindiscussion', 'lightningnetwork']
-            all_posts = []
+            # Single multireddit listing; each submission still reports its own subreddit.
+            all_posts = self.get_trending_posts(_BITCOIN_MULTI, limit=8 * len(BITCOIN_SUBREDDITS))
             
-            for subreddit_name in bitcoin_subreddits:
-                posts = self.get_trending_posts_praw(subreddit_name, limit=8)
-                all_posts.extend(posts)
-            
-            # Sort by engagement score
-            all_posts.sort(key=lambda x: x['score'] + (x['num_comments'] * 2), reverse=True)
-            return all_posts[:limit]
+            # Top posts by engagement score
+            return heapq.nlargest(limit, all_posts, key=_engagement)
         else:
             # Fallback to public API
             return self.get_trending_topics(['bitcoin', 'bitcoinbeginners'], limit=limit)
@@ -265,84 +495,77 @@ class RedditService:
     def get_defi_trending_topics(self, limit: int = 20) -> List[Dict]:
         """Get trending DeFi-related topics using PRAW"""
         if self.use_api:
-            defi_subreddits = ['defi', 'decentralizedfinance', 'ethfinance']
-            all_posts = []
-            
-            for subreddit_name in defi_subreddits:
-                posts = self.get_trending_posts_praw(subreddit_name, limit=8)
-                all_posts.extend(posts)
+            # Single multireddit listing; each submission still reports its own subreddit.
+            all_posts = self.get_trending_posts(_DEFI_MULTI, limit=8 * len(DEFI_SUBREDDITS))
             
-            # Sort by engagement score
-            all_posts.sort(key=lambda x: x['score'] + (x['num_comments'] * 2), reverse=True)
-            return all_posts[:limit]
+            # Top posts by engagement score
+            return heapq.nlargest(limit, all_posts, key=_engagement)
         else:
             # Fallback to public API
             return self.get_trending_topics(['defi', 'cryptocurrency'], limit=limit)
 
     def get_content_ideas(self, topic_type: str = "bitcoin", limit: int = 5) -> List[Dict]:
         """Get content ideas based on trending topics"""
-        if topic_type.lower() == "bitcoin":
+        topic = topic_type.lower()
+        if topic == "bitcoin":
             posts = self.get_bitcoin_trending_topics(limit=15)
-        elif topic_type.lower() == "defi":
+        elif topic == "defi":
             posts = self.get_defi_trending_topics(limit=15)
         else:
             posts = self.get_trending_topics(['cryptocurrency', 'cryptomarkets'], limit=15)
         
-        # Convert to content ideas
+        # Convert to content ideas; only posts that clear the threshold are materialized
         content_ideas = []
         for post in posts[:limit]:
-            if isinstance(post, dict):
-                score = post.get('score', 0)
-                comments = post.get('num_comments', 0)
-                
-                if score > 50 and comments > 10:  # Minimum engagement threshold
-                    idea = {
-                        'title': post.get('title', ''),
-                        'article_angle': self._generate_article_angle(post),
-                        'source_url': post.get('permalink', ''),
-                        'engagement_score': score + comments,
-                        'subreddit': post.get('subreddit', ''),
-                        'created': post.get('created_utc', datetime.now()).strftime('%Y-%m-%d %H:%M') if isinstance(post.get('created_utc'), datetime) else 'Unknown'
-                    }
-                    content_ideas.append(idea)
+            if not isinstance(post, dict):
+                continue
+            score = post.get('score', 0)
+            comments = post.get('num_comments', 0)
+            if score <= 50 or comments <= 10:  # Minimum engagement threshold
+                continue
+            created = post.get('created_utc')
+            content_ideas.append({
+                'title': post.get('title', ''),
+                'article_angle': self._generate_article_angle(post),
+                'source_url': post.get('permalink', ''),
+                'engagement_score': score + comments,
+                'subreddit': post.get('subreddit', ''),
+                'created': datetime.fromtimestamp(created).strftime('%Y-%m-%d %H:%M') if created else 'Unknown'
+            })
         
         return content_ideas
 
     def _generate_article_angle(self, post: Dict) -> str:
         """Generate a potential article angle from a Reddit post"""
-        title = post.get('title', '').lower()
+        title = post.get('title') or ''
         
-        # Common article angles based on post content
-        if any(word in title for word in ['price', 'surge', 'rally', 'pump']):
-            return "Market Analysis: Price Movement Deep Dive"
-        elif any(word in title for word in ['adoption', 'institutional', 'company']):
-            return "Adoption News: Industry Impact Analysis"
-        elif any(word in title for word in ['technical', 'upgrade', 'update', 'protocol']):
-            return "Technical Analysis: Technology Advancement"
-        elif any(word in title for word in ['regulation', 'legal', 'sec', 'government']):
-            return "Regulatory Update: Policy Impact Assessment"
-        elif any(word in title for word in ['hack', 'security', 'exploit']):
-            return "Security Alert: Risk Analysis and Prevention"
-        elif any(word in title for word in ['defi', 'yield', 'liquidity', 'protocol']):
-            return "DeFi Deep Dive: Protocol Analysis"
-        else:
-            return "Community Spotlight: Trending Discussion Analysis"
+        # Common article angles based on post content, first match wins
+        for pattern, angle in _ANGLE_PATTERNS:
+            if pattern.search(title):
+                return angle
+        return _DEFAULT_ANGLE
 
     def test_connection(self) -> bool:
         """Test Reddit API connection"""
+        # Only successes are cached so failures surface on the next check.
+        if time.monotonic() - self._last_ok_ts < CONNECTION_OK_TTL:
+            return True
+        if not self._acquire_slot("connection test"):
+            return False
         if self.use_api and self.reddit:
             try:
-                subreddit = self.reddit.subreddit('bitcoin')
+                subreddit = self._subreddit('bitcoin')
                 next(subreddit.hot(limit=1))
-                return True
             except Exception as e:
                 logging.error(f"Reddit PRAW connection test failed: {e}")
                 return False
         else:
             # Test public API fallback
             try:
-                import requests
-                response = requests.get("https://www.reddit.com/r/bitcoin/hot.json?limit=1", timeout=5)
-                return response.status_code == 200
-            except:
-                return False
\ No newline at end of file
+                response = self.session.get("https://www.reddit.com/r/bitcoin/hot.json?limit=1", timeout=5)
+            except Exception:
+                return False
+            if response.status_code != 200:
+                return False
+        self._last_ok_ts = time.monotonic()
+        return True
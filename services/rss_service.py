@@ -1,11 +1,30 @@
+import calendar
 import feedparser
+import hashlib
 import requests
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import islice
+from operator import itemgetter
 from typing import List, Dict, Optional
+from xml.etree.ElementTree import Element, SubElement, indent, tostring
 from app import db
 import models
 
+# Feed downloads block on the network; fetch the configured shows side by side.
+FEED_FETCH_WORKERS = 4
+FEED_TIMEOUT = 10
+EPISODE_CACHE_MAX = 500
+FEED_CACHE_TTL = 300  # episodes/show info/per-show views share one fetch per feed in this window
+# We only read plain fields and strip tags ourselves in clean_description, so skip feedparser's
+# HTML sanitizer and relative-URI rewriting passes (the bulk of its parse time on large feeds).
+FEED_PARSE_OPTIONS = {'sanitize_html': False, 'resolve_relative_uris': False}
+
+_TAG_RE = re.compile(r'<[^>]*>')
+
 class RSSService:
     """Service for managing RSS feed synchronization and generation"""
     
@@ -16,6 +35,8 @@ class RSSService:
         'orange is the nw jill',
         'orange is the new jill'
     ]
+    # Lowercased, de-duplicated once for the per-entry exclusion check
+    _EXCLUDED_LOWER = tuple(dict.fromkeys(show.lower() for show in EXCLUDED_SHOWS))
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -38,17 +59,112 @@ class RSSService:
             }
         ]
         
+        # show_id (as exposed by get_show_info) -> feed config
+        self._show_id_map = {self._slugify(cfg['name']): cfg for cfg in self.podcast_feeds}
+        
         # Episode cache for real-time display
         self._episode_cache = {}
         self._cache_expiry = None
+        # (title_lc, description_lc, episode) for cached episodes, newest first
+        self._search_index = []
+        
+        # Parsed feeds per URL with their ETag/Last-Modified validators
+        self._feed_cache = {}
+        
+        # Shared keep-alive session for feed downloads (feedparser's own fetcher has no timeout)
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'ProtocolPulse/1.0 (+podcast feed sync)'})
+    
+    def _download_feed(self, url: str):
+        """Download raw feed bytes plus the headers feedparser uses for encoding/relative URLs.
+        Revalidates against the cached copy; returns None when the server answers 304."""
+        cached = self._feed_cache.get(url)
+        request_headers = {}
+        if cached:
+            if cached['etag']:
+                request_headers['If-None-Match'] = cached['etag']
+            if cached['modified']:
+                request_headers['If-Modified-Since'] = cached['modified']
+        response = self.session.get(url, headers=request_headers, timeout=FEED_TIMEOUT)
+        if response.status_code == 304 and cached:
+            return None
+        response.raise_for_status()
+        headers = {
+            'content-location': response.url,
+            'content-type': response.headers.get('content-type', ''),
+            'etag': response.headers.get('ETag'),
+            'last-modified': response.headers.get('Last-Modified'),
+        }
+        return response.content, headers
+    
+    def _fresh_feed(self, url: str):
+        """Parsed feed from the per-URL cache, if still within its TTL"""
+        cached = self._feed_cache.get(url)
+        if cached and time.time() < cached['expires']:
+            return cached['feed']
+        return None
+    
+    def _store_feed(self, url: str, download):
+        """Parse a download (or reuse the cached feed on 304) and refresh its cache entry"""
+        if download is None:
+            cached = self._feed_cache[url]
+            cached['expires'] = time.time() + FEED_CACHE_TTL
+            return cached['feed']
+        body, headers = download
+        feed = feedparser.parse(body, response_headers=headers, **FEED_PARSE_OPTIONS)
+        self._feed_cache[url] = {
+            'expires': time.time() + FEED_CACHE_TTL,
+            'etag': headers['etag'],
+            'modified': headers['last-modified'],
+            'feed': feed,
+        }
+        return feed
+    
+    def _parse_feed(self, url: str):
+        """Fetch (or reuse) and parse a single feed"""
+        feed = self._fresh_feed(url)
+        if feed is None:
+            feed = self._store_feed(url, self._download_feed(url))
+        return feed
+    
+    def _fetch_feeds(self) -> List[tuple]:
+        """Download all stale configured feeds concurrently, then parse them on this thread.
+        Returns (feed_config, feed, error) tuples in config order."""
+        def _fetch(feed_config):
+            try:
+                return self._download_feed(feed_config['url']), None
+            except Exception as e:
+                return None, e
+        
+        fresh = {cfg['url']: self._fresh_feed(cfg['url']) for cfg in self.podcast_feeds}
+        stale = [cfg for cfg in self.podcast_feeds if fresh[cfg['url']] is None]
+        downloads = {}
+        if stale:
+            workers = min(FEED_FETCH_WORKERS, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                downloads = dict(zip((cfg['url'] for cfg in stale), executor.map(_fetch, stale)))
+        
+        results = []
+        for feed_config in self.podcast_feeds:
+            url = feed_config['url']
+            feed, error = fresh[url], None
+            if feed is None:
+                download, error = downloads[url]
+                if error is None:
+                    feed = self._store_feed(url, download)
+            results.append((feed_config, feed, error))
+        return results
     
     def sync_all_feeds(self) -> Dict[str, int]:
         """Synchronize all configured podcast RSS feeds"""
         results = {}
         
-        for feed_config in self.podcast_feeds:
+        # Network fetches run in parallel; DB writes stay on this thread (the session is not thread-safe)
+        for feed_config, feed, error in self._fetch_feeds():
             try:
-                count = self.sync_feed(feed_config['url'], feed_config['category'], feed_config['name'])
+                if error:
+                    raise error
+                count = self.sync_feed(feed_config['url'], feed_config['category'], feed_config['name'], feed=feed)
                 results[feed_config['name']] = count
                 self.logger.info(f"Synced {count} episodes from {feed_config['name']}")
             except Exception as e:
@@ -57,27 +173,44 @@ class RSSService:
         
         return results
     
-    def sync_feed(self, rss_url: str, category: str = "Web3", rss_source: str = "Protocol Pulse") -> int:
-        """Sync individual RSS feed to database"""
+    def sync_feed(self, rss_url: str, category: str = "Web3", rss_source: str = "Protocol Pulse", feed=None) -> int:
+        """Sync individual RSS feed to database (pass an already-parsed feed to skip the fetch)"""
         try:
-            feed = feedparser.parse(rss_url)
+            if feed is None:
+                feed = self._parse_feed(rss_url)
             synced_count = 0
             
+            # The show-name half of the exclusion check is the same for every entry
+            source_lc = rss_source.lower()
+            if any(excluded in source_lc for excluded in self._EXCLUDED_LOWER):
+                self.logger.info(f"Filtering out excluded feed: {rss_source}")
+                return 0
+            
+            entries = []
             for entry in feed.entries:
+                title_lc = entry.title.lower()
                 # Skip excluded content - HARD BLOCK on "Jill" in any form
-                if self._is_excluded_content(entry.title, rss_source):
-                    continue
-                if 'jill' in entry.title.lower():
+                if 'jill' in title_lc or any(excluded in title_lc for excluded in self._EXCLUDED_LOWER):
                     continue
+                entries.append(entry)
+            if not entries:
+                return 0
+            
+            # One query for the episodes we already have instead of one per entry
+            titles = list({entry.title for entry in entries})
+            existing = {
+                tuple(row) for row in
+                db.session.query(models.Podcast.title, models.Podcast.audio_url)
+                .filter(models.Podcast.title.in_(titles))
+            }
+            
+            for entry in entries:
+                audio_url = self.extract_audio_url(entry)
                 
                 # Check if episode already exists
-                existing = models.Podcast.query.filter_by(
-                    title=entry.title,
-                    audio_url=self.extract_audio_url(entry)
-                ).first()
-                
-                if existing:
+                if (entry.title, audio_url) in existing:
                     continue
+                existing.add((entry.title, audio_url))
                 
                 # Create new podcast episode
                 podcast = models.Podcast()
@@ -85,7 +218,7 @@ class RSSService:
                 podcast.description = self.clean_description(entry.get('description', ''))
                 podcast.host = feed.feed.get('author', 'Protocol Pulse')
                 podcast.duration = self.extract_duration(entry)
-                podcast.audio_url = self.extract_audio_url(entry)
+                podcast.audio_url = audio_url
                 podcast.cover_image_url = self.extract_cover_image(entry, feed)
                 podcast.published_date = self.parse_date(entry.get('published_parsed'))
                 podcast.category = category
@@ -150,19 +283,31 @@ class RSSService:
     
     def clean_description(self, description: str) -> str:
         """Clean and truncate description"""
-        import re
-        # Remove HTML tags
-        clean_desc = re.sub(r'<[^>]*>', '', description)
+        # Remove HTML tags (plain-text descriptions skip the regex pass)
+        clean_desc = _TAG_RE.sub('', description) if '<' in description else description
         # Limit length
         if len(clean_desc) > 500:
             clean_desc = clean_desc[:497] + "..."
         return clean_desc.strip()
     
+    @staticmethod
+    def _slugify(name: str) -> str:
+        """Show id used in URLs, e.g. "Protocol Pulse" -> protocol_pulse"""
+        return name.lower().replace(' ', '_').replace("'", '')
+    
+    @staticmethod
+    def _episode_id(entry) -> int:
+        """Stable episode id from the entry link (or title). 48 bits keeps it exact as a JS number;
+        the builtin hash() is salted per process, so ids used to change on every restart."""
+        key = entry.get('link') or entry.title
+        return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=6).digest(), 'little')
+    
     def _is_excluded_content(self, title: str, show_name: str = '') -> bool:
         """Check if content should be excluded based on title or show name"""
-        check_text = f"{title} {show_name}".lower()
-        for excluded in self.EXCLUDED_SHOWS:
-            if excluded.lower() in check_text:
+        title_lc = title.lower()
+        show_lc = show_name.lower()
+        for excluded in self._EXCLUDED_LOWER:
+            if excluded in title_lc or excluded in show_lc:
                 self.logger.info(f"Filtering out excluded content: {title}")
                 return True
         return False
@@ -171,19 +316,24 @@ class RSSService:
         """Parse RSS date tuple to datetime"""
         if date_tuple:
             try:
-                import time
-                return datetime.fromtimestamp(time.mktime(date_tuple))
+                # feedparser normalizes dates to UTC struct_time; timegm keeps it UTC (mktime assumed local time)
+                return datetime.utcfromtimestamp(calendar.timegm(date_tuple))
             except:
                 pass
         return datetime.utcnow()
     
     def generate_rss_feed(self) -> str:
         """Generate RSS feed XML for published podcasts"""
-        from xml.etree.ElementTree import Element, SubElement, tostring
-        from xml.dom import minidom
-        
-        # Get latest published podcasts
-        podcasts = models.Podcast.query.order_by(models.Podcast.published_date.desc()).limit(50).all()
+        # Get latest published podcasts (only the columns the feed needs, as lightweight rows)
+        Podcast = models.Podcast
+        podcasts = (
+            Podcast.query
+            .with_entities(Podcast.id, Podcast.title, Podcast.description, Podcast.audio_url,
+                           Podcast.published_date, Podcast.duration)
+            .order_by(Podcast.published_date.desc())
+            .limit(50)
+            .all()
+        )
         
         # Create RSS XML
         rss = Element('rss', version='2.0')
@@ -217,24 +367,22 @@ class RSSService:
             if podcast.duration:
                 SubElement(item, 'itunes:duration').text = podcast.duration
         
-        # Pretty print XML
-        rough_string = tostring(rss, 'utf-8')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ")
+        # Pretty print XML in place (no serialize/reparse round trip through minidom)
+        indent(rss, space="  ")
+        return tostring(rss, encoding='utf-8', xml_declaration=True).decode('utf-8')
     
     def get_latest_episodes(self, limit: int = 20) -> List[Dict]:
         """Get latest episodes from all feeds with caching"""
-        import time
-        
         # Check cache validity (15 minute cache)
         if self._cache_expiry and time.time() < self._cache_expiry and self._episode_cache:
-            return list(self._episode_cache.values())[:limit]
+            return list(islice(self._episode_cache.values(), limit))
         
         all_episodes = []
         
-        for feed_config in self.podcast_feeds:
+        for feed_config, feed, error in self._fetch_feeds():
             try:
-                feed = feedparser.parse(feed_config['url'])
+                if error:
+                    raise error
                 show_name = feed_config['name']
                 
                 for entry in feed.entries[:10]:  # Get latest 10 per show
@@ -243,7 +391,7 @@ class RSSService:
                         continue
                     
                     episode = {
-                        'id': hash(entry.get('link', entry.title))  % 100000,
+                        'id': self._episode_id(entry),
                         'title': entry.title,
                         'description': self.clean_description(entry.get('description', '')),
                         'audio_url': self.extract_audio_url(entry),
@@ -260,11 +408,17 @@ class RSSService:
             except Exception as e:
                 self.logger.error(f"Error fetching {feed_config['name']}: {e}")
         
-        # Sort by date, newest first
-        all_episodes.sort(key=lambda x: x['published_date'], reverse=True)
+        # Sort by date, newest first. The cache keeps the full ordered list because it also
+        # serves later calls with a larger limit, so this stays a full sort rather than a top-k.
+        all_episodes.sort(key=itemgetter('published_date'), reverse=True)
         
         # Update cache
-        self._episode_cache = {ep['id']: ep for ep in all_episodes}
+        # Bounded to the newest EPISODE_CACHE_MAX; the dict keeps that newest-first order
+        self._episode_cache = {ep['id']: ep for ep in islice(all_episodes, EPISODE_CACHE_MAX)}
+        self._search_index = [
+            (ep['title'].lower(), ep['description'].lower(), ep)
+            for ep in self._episode_cache.values()
+        ]
         self._cache_expiry = time.time() + (15 * 60)  # 15 minutes
         
         return all_episodes[:limit]
@@ -272,11 +426,14 @@ class RSSService:
     def get_show_info(self) -> List[Dict]:
         """Get information about all podcast shows"""
         shows = []
-        for feed_config in self.podcast_feeds:
+        for feed_config, feed, error in self._fetch_feeds():
             try:
-                feed = feedparser.parse(feed_config['url'])
+                if error:
+                    # Still list the show, just without feed metadata
+                    self.logger.warning(f"Could not fetch feed for {feed_config['name']}: {error}")
+                    feed = feedparser.FeedParserDict()
                 show = {
-                    'id': feed_config['name'].lower().replace(' ', '_').replace("'", ''),
+                    'id': self._slugify(feed_config['name']),
                     'name': feed_config['name'],
                     'description': feed.feed.get('description', '')[:200] if hasattr(feed, 'feed') else '',
                     'host': feed_config.get('host', 'Protocol Pulse'),
@@ -304,51 +461,53 @@ class RSSService:
     
     def get_episodes_by_show(self, show_id: str, limit: int = 20) -> List[Dict]:
         """Get episodes for a specific show"""
-        for feed_config in self.podcast_feeds:
-            config_id = feed_config['name'].lower().replace(' ', '_').replace("'", '')
-            if config_id == show_id:
-                try:
-                    feed = feedparser.parse(feed_config['url'])
-                    episodes = []
-                    for entry in feed.entries[:limit]:
-                        # Skip excluded content
-                        if self._is_excluded_content(entry.title, feed_config['name']):
-                            continue
-                        
-                        episode = {
-                            'id': hash(entry.get('link', entry.title)) % 100000,
-                            'title': entry.title,
-                            'description': self.clean_description(entry.get('description', '')),
-                            'audio_url': self.extract_audio_url(entry),
-                            'duration': self.extract_duration(entry),
-                            'published_date': self.parse_date(entry.get('published_parsed')),
-                            'cover_image': self.extract_cover_image(entry, feed),
-                            'show_name': feed_config['name'],
-                            'host': feed_config.get('host', 'Protocol Pulse'),
-                            'color': feed_config.get('color', '#dc2626')
-                        }
-                        episodes.append(episode)
-                    return episodes
-                except Exception as e:
-                    self.logger.error(f"Error fetching episodes for {show_id}: {e}")
+        feed_config = self._show_id_map.get(show_id)
+        if feed_config is None:
+            return []
+        try:
+            feed = self._parse_feed(feed_config['url'])
+            episodes = []
+            for entry in feed.entries[:limit]:
+                # Skip excluded content
+                if self._is_excluded_content(entry.title, feed_config['name']):
+                    continue
+                
+                episode = {
+                    'id': self._episode_id(entry),
+                    'title': entry.title,
+                    'description': self.clean_description(entry.get('description', '')),
+                    'audio_url': self.extract_audio_url(entry),
+                    'duration': self.extract_duration(entry),
+                    'published_date': self.parse_date(entry.get('published_parsed')),
+                    'cover_image': self.extract_cover_image(entry, feed),
+                    'show_name': feed_config['name'],
+                    'host': feed_config.get('host', 'Protocol Pulse'),
+                    'color': feed_config.get('color', '#dc2626')
+                }
+                episodes.append(episode)
+            return episodes
+        except Exception as e:
+            self.logger.error(f"Error fetching episodes for {show_id}: {e}")
         return []
     
     def clear_cache(self):
         """Clear the episode cache to force refresh"""
         self._episode_cache = {}
+        self._search_index = []
         self._cache_expiry = None
+        self._feed_cache = {}
         self.logger.info("RSS episode cache cleared")
     
     def search_episodes(self, query: str, limit: int = 10) -> List[Dict]:
         """Search episodes by title or description"""
-        all_episodes = self.get_latest_episodes(limit=50)
+        self.get_latest_episodes(limit=50)  # refreshes the cache/search index when stale
         query_lower = query.lower()
-        results = [
-            ep for ep in all_episodes
-            if (query_lower in ep['title'].lower() or query_lower in ep['description'].lower())
-            and not self._is_excluded_content(ep['title'], ep.get('show_name', ''))
-        ]
-        return results[:limit]
+        # Cached episodes already passed the exclusion filter and carry pre-lowered fields
+        results = (
+            ep for title_lc, desc_lc, ep in islice(self._search_index, 50)
+            if query_lower in title_lc or query_lower in desc_lc
+        )
+        return list(islice(results, limit))
 
 
 # Global instance for convenience
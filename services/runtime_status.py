@@ -5,30 +5,83 @@ Lightweight runtime status store for health reporting and self-check gates.
 from __future__ import annotations
 
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 STATUS_PATH = Path("/home/ultron/protocol_pulse/logs/runtime_status.json")
 
+# Last decoded status and the (mtime_ns, size) it was read at; the file is only re-read
+# when another process has rewritten it.
+_CACHE: Dict[str, Any] = {}
+_CACHE_STAMP: Optional[Tuple[int, int]] = None
+_lock = threading.RLock()
 
-def _load() -> Dict[str, Any]:
-    if not STATUS_PATH.exists():
-        return {}
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Dict[str, Any]) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Dict[str, Any]) -> bytes:
+        return json.dumps(obj, ensure_ascii=True, indent=2).encode("utf-8")
+
+
+def _stamp() -> Optional[Tuple[int, int]]:
     try:
-        return json.loads(STATUS_PATH.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+        st = STATUS_PATH.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load() -> Dict[str, Any]:
+    global _CACHE, _CACHE_STAMP
+    with _lock:
+        stamp = _stamp()
+        if stamp is None:
+            return {}
+        if stamp != _CACHE_STAMP:
+            try:
+                _CACHE = _loads(STATUS_PATH.read_bytes())
+            except Exception:
+                return {}
+            _CACHE_STAMP = stamp
+        return dict(_CACHE)
 
 
 def update_status(section: str, payload: Dict[str, Any]) -> None:
-    current = _load()
-    current[section] = payload
-    current["updated_at"] = datetime.utcnow().isoformat()
-    STATUS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    STATUS_PATH.write_text(json.dumps(current, ensure_ascii=True, indent=2), encoding="utf-8")
+    global _CACHE, _CACHE_STAMP
+    with _lock:
+        current = _load()
+        current[section] = payload
+        current["updated_at"] = datetime.utcnow().isoformat()
+        # Write beside the target and rename so readers never see a half-written file.
+        tmp = f"{STATUS_PATH}.{os.getpid()}.tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = os.open(tmp, flags, 0o644)
+        except FileNotFoundError:
+            # Only create the log directory when it is actually missing.
+            STATUS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp, flags, 0o644)
+        try:
+            os.write(fd, _dumps(current))
+        finally:
+            os.close(fd)
+        os.replace(tmp, STATUS_PATH)
+        _CACHE, _CACHE_STAMP = current, _stamp()
 
 
 def get_status() -> Dict[str, Any]:
     return _load()
-
@@ -5,6 +5,8 @@ and sentiment/signal pipelines. Persists to CollectedSignal for use by briefing_
 
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
@@ -18,11 +20,15 @@ LEGENDARY_HANDLES = {
     "_checkmatey_", "woonomic", "natbrunell", "nvk", "coryklippsten",
 }
 
+X_FETCH_WORKERS = 8
+
 
 class SentimentTrackerService:
     def __init__(self):
         self._x_client = None
         self._x_client_v2 = None
+        self._x_auth = None
+        self._x_local = threading.local()
         try:
             import os
             import tweepy
@@ -40,6 +46,7 @@ class SentimentTrackerService:
                     os.environ.get("TWITTER_ACCESS_TOKEN"),
                     os.environ.get("TWITTER_ACCESS_TOKEN_SECRET"),
                 )
+                self._x_auth = auth
                 self._x_client = tweepy.API(auth, wait_on_rate_limit=True)
                 logger.info("SentimentTracker: X API initialized")
         except Exception as e:
@@ -54,40 +61,66 @@ class SentimentTrackerService:
             handles = [str(h).strip().lstrip("@") for h in handles if str(h).strip()]
         else:
             handles = list(LEGENDARY_HANDLES)[:15]
-        for handle in handles:
-            try:
-                user = self._x_client.get_user(screen_name=handle)
-                if not user:
+        if not handles:
+            return out
+        cutoff = datetime.utcnow() - timedelta(hours=hours_back)
+        # Each handle is two round trips (get_user + user_timeline); fetch them side by side.
+        with ThreadPoolExecutor(max_workers=min(X_FETCH_WORKERS, len(handles))) as pool:
+            futs = [pool.submit(self._fetch_x_handle, h, cutoff, max_per_user) for h in handles]
+            for fut in futs:
+                out.extend(fut.result())
+        return out
+
+    def _worker_x_client(self):
+        """tweepy.API for the calling worker thread.
+
+        tweepy.API and its requests.Session are not safe to share across threads, so each
+        fetch_x_posts worker builds its own from the same OAuth handler.
+        """
+        api = getattr(self._x_local, "api", None)
+        if api is None:
+            import tweepy
+            api = tweepy.API(self._x_auth, wait_on_rate_limit=True)
+            self._x_local.api = api
+        return api
+
+    def _fetch_x_handle(self, handle, cutoff, max_per_user):
+        """Recent posts for one X handle since cutoff; [] on any API error."""
+        out = []
+        try:
+            client = self._worker_x_client()
+            user = client.get_user(screen_name=handle)
+            if not user:
+                return out
+            tweets = client.user_timeline(
+                user_id=user.id, count=max_per_user, tweet_mode="extended", include_rts=False
+            )
+            for t in tweets:
+                created = t.created_at
+                if created.replace(tzinfo=None) < cutoff:
                     continue
-                tweets = self._x_client.user_timeline(
-                    user_id=user.id, count=max_per_user, tweet_mode="extended", include_rts=False
-                )
-                for t in tweets:
-                    created = t.created_at
-                    if created.replace(tzinfo=None) < datetime.utcnow() - timedelta(hours=hours_back):
-                        continue
-                    text = getattr(t, "full_text", None) or getattr(t, "text", "") or ""
-                    if not text or len(text) < 20:
-                        continue
-                    post_id = f"x_{t.id}"
-                    engagement = (t.favorite_count or 0) + (t.retweet_count or 0) * 2
-                    out.append({
-                        "platform": "x",
-                        "post_id": post_id,
-                        "author_name": user.name,
-                        "author_handle": handle,
-                        "author_tier": "macro",
-                        "content": text[:2000],
-                        "url": f"https://twitter.com/{handle}/status/{t.id}",
-                        "engagement_likes": t.favorite_count or 0,
-                        "engagement_reposts": t.retweet_count or 0,
-                        "engagement_replies": 0,
-                        "engagement_score": float(engagement),
-                        "posted_at": created,
-                        "is_legendary": handle.lower() in LEGENDARY_HANDLES,
-                    })
-            except Exception as e:
-                logger.debug("X fetch %s: %s", handle, e)
+                text = getattr(t, "full_text", None) or getattr(t, "text", "") or ""
+                if not text or len(text) < 20:
+                    continue
+                post_id = f"x_{t.id}"
+                engagement = (t.favorite_count or 0) + (t.retweet_count or 0) * 2
+                out.append({
+                    "platform": "x",
+                    "post_id": post_id,
+                    "author_name": user.name,
+                    "author_handle": handle,
+                    "author_tier": "macro",
+                    "content": text[:2000],
+                    "url": f"https://twitter.com/{handle}/status/{t.id}",
+                    "engagement_likes": t.favorite_count or 0,
+                    "engagement_reposts": t.retweet_count or 0,
+                    "engagement_replies": 0,
+                    "engagement_score": float(engagement),
+                    "posted_at": created,
+                    "is_legendary": handle.lower() in LEGENDARY_HANDLES,
+                })
+        except Exception as e:
+            logger.debug("X fetch %s: %s", handle, e)
         return out
 
     def fetch_nostr_notes(self, hours_back=24, limit=30):
@@ -0,0 +1,25 @@
+import pytest
+
+
+class FakeClock:
+    """Stands in for a module's ``time`` import so TTLs and backoffs can be stepped, not slept."""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
@@ -0,0 +1,74 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+
+VERSIONS = Path(__file__).resolve().parents[1] / "migrations" / "versions"
+
+
+def _load(name):
+    spec = importlib.util.spec_from_file_location(name, VERSIONS / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+unique_external_id = _load("e2b3c4d5e6f7_unique_kol_pulse_item_external_id")
+
+
+@pytest.fixture
+def conn():
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as connection:
+        yield connection
+
+
+def _run(conn, fn):
+    with Operations.context(MigrationContext.configure(conn)):
+        fn()
+
+
+def _unique_indexes(conn):
+    return {
+        i["name"] for i in sa.inspect(conn).get_indexes("kol_pulse_item")
+        if i.get("unique") and i.get("column_names") == ["external_id"]
+    }
+
+
+def _create_table(conn, unique=False):
+    conn.execute(sa.text(
+        "CREATE TABLE kol_pulse_item (id INTEGER PRIMARY KEY, external_id VARCHAR(128))"
+    ))
+    if unique:
+        conn.execute(sa.text(
+            "CREATE UNIQUE INDEX ix_kol_pulse_item_external_id ON kol_pulse_item (external_id)"
+        ))
+
+
+def test_upgrade_adds_missing_unique_index(conn):
+    _create_table(conn)
+
+    _run(conn, unique_external_id.upgrade)
+    assert _unique_indexes(conn) == {"uq_kol_pulse_item_external_id"}
+
+    _run(conn, unique_external_id.downgrade)
+    assert _unique_indexes(conn) == set()
+
+
+def test_upgrade_keeps_existing_unique_index(conn):
+    _create_table(conn, unique=True)
+
+    _run(conn, unique_external_id.upgrade)
+    _run(conn, unique_external_id.downgrade)
+
+    assert _unique_indexes(conn) == {"ix_kol_pulse_item_external_id"}
+
+
+def test_upgrade_skips_missing_table(conn):
+    _run(conn, unique_external_id.upgrade)
+    _run(conn, unique_external_id.downgrade)
+
+    assert "kol_pulse_item" not in sa.inspect(conn).get_table_names()
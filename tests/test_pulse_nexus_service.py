@@ -0,0 +1,346 @@
+import logging
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from services import pulse_nexus_service as pulse
+from services.rate_limiter import TokenBucket
+
+
+class FakeTweet(SimpleNamespace):
+    # tweepy.Tweet supports both attribute and mapping access.
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+class FakeXClient:
+    def __init__(self):
+        self.lookups = []
+        self.timelines = []
+
+    def get_users(self, usernames):
+        self.lookups.append(list(usernames))
+        return SimpleNamespace(data=[SimpleNamespace(username=u, id=f"id_{u}") for u in usernames])
+
+    def get_users_tweets(self, user_id, **kwargs):
+        self.timelines.append(user_id)
+        tweet = FakeTweet(id=f"t_{user_id}", author_id=user_id, text="bitcoin " * 5)
+        return SimpleNamespace(data=[tweet], includes={})
+
+
+@pytest.fixture
+def x_client(monkeypatch):
+    client = FakeXClient()
+    monkeypatch.setattr(pulse, "_X_USER_IDS", {})
+    monkeypatch.setattr(pulse, "X_HANDLE_TIMEOUT", 2)
+    monkeypatch.setitem(
+        sys.modules, "services.x_service",
+        types.SimpleNamespace(XService=lambda: SimpleNamespace(client_v2=client)),
+    )
+    return client
+
+
+def test_x_endpoints_have_separate_buckets(monkeypatch, x_client):
+    monkeypatch.setattr(pulse, "_X_LOOKUP_BUCKET", TokenBucket(1, 1e-9))
+    monkeypatch.setattr(pulse, "_X_TIMELINE_BUCKET", TokenBucket(20, 1e-9))
+    handles = [f"h{i}" for i in range(20)]
+
+    items = pulse.fetch_pulse_x(handles)
+
+    # One users/by call resolves every handle and leaves the whole timeline budget intact.
+    assert len(x_client.lookups) == 1
+    assert len(x_client.timelines) == 20
+    assert {i["author_handle"] for i in items} == set(handles)
+
+
+def test_rate_limited_handles_are_logged(monkeypatch, caplog, x_client):
+    monkeypatch.setattr(pulse, "_X_LOOKUP_BUCKET", TokenBucket(1, 1e-9))
+    monkeypatch.setattr(pulse, "_X_TIMELINE_BUCKET", TokenBucket(2, 1e-9))
+
+    with caplog.at_level(logging.WARNING, logger=pulse.logger.name):
+        items = pulse.fetch_pulse_x(["a", "b", "c", "d"])
+
+    assert len(items) == 2
+    assert "skipped 2 handle(s)" in caplog.text
+
+
+def test_exhausted_lookup_budget_is_logged(monkeypatch, caplog, x_client):
+    monkeypatch.setattr(pulse, "_X_LOOKUP_BUCKET", TokenBucket(1, 1e-9))
+    pulse._X_LOOKUP_BUCKET.acquire()
+
+    with caplog.at_level(logging.WARNING, logger=pulse.logger.name):
+        assert pulse.fetch_pulse_x(["a"]) == []
+
+    assert x_client.lookups == []
+    assert "users/by rate budget exhausted" in caplog.text
+
+
+class FakeWS:
+    connected = True
+
+    def close(self):
+        self.connected = False
+
+
+@pytest.fixture
+def relay_pool(monkeypatch, clock):
+    monkeypatch.setattr(pulse, "time", clock)
+    pool = pulse._RelayPool()
+    pool.dials = []
+    pool.down = True
+    pool.probe_ok = False
+
+    def create_connection(url, timeout=None):
+        pool.dials.append(url)
+        if pool.down:
+            raise ConnectionError("refused")
+        return FakeWS()
+
+    monkeypatch.setattr(pulse.websocket, "create_connection", create_connection)
+    monkeypatch.setattr(pulse._RelayPool, "_probe", classmethod(lambda cls, url: pool.probe_ok))
+    return pool
+
+
+URL = "wss://relay.example"
+
+
+def test_failed_relay_is_skipped_during_backoff(relay_pool, clock):
+    with pytest.raises(ConnectionError):
+        relay_pool.acquire(URL)
+    assert len(relay_pool.dials) == 1
+
+    clock.advance(pulse._RelayPool.MIN_BACKOFF - 1)
+    with pytest.raises(ConnectionError, match="backing off"):
+        relay_pool.acquire(URL)
+    assert len(relay_pool.dials) == 1
+
+
+def test_backoff_doubles_up_to_the_cap(relay_pool, clock):
+    delays = []
+    for _ in range(5):
+        relay_pool.mark_failed(URL)
+        delays.append(relay_pool._failures[URL][1] - clock.now)
+    assert delays == [60, 120, 240, 300, 300]
+
+
+def test_failed_probe_extends_backoff_without_dialing(relay_pool, clock):
+    relay_pool.mark_failed(URL)
+    clock.advance(pulse._RelayPool.MIN_BACKOFF)
+
+    with pytest.raises(ConnectionError, match="NIP-11"):
+        relay_pool.acquire(URL)
+    assert relay_pool.dials == []
+    assert relay_pool._failures[URL][0] == 2
+
+
+def test_recovered_relay_clears_failures(relay_pool, clock):
+    relay_pool.mark_failed(URL)
+    clock.advance(pulse._RelayPool.MIN_BACKOFF)
+    relay_pool.down = False
+    relay_pool.probe_ok = True
+
+    ws = relay_pool.acquire(URL)
+    assert ws.connected
+    assert URL not in relay_pool._failures
+
+
+def _note(n, created_at, pubkey="pk"):
+    item = {
+        "platform": "nostr", "author_handle": pubkey, "author_name": pubkey,
+        "content": f"note {n}", "url": f"https://njump.me/{n}", "external_id": f"nostr_{n}",
+    }
+    return (pubkey, created_at, item)
+
+
+@pytest.fixture
+def nostr_cursors(monkeypatch, tmp_path):
+    monkeypatch.setattr(pulse, "NOSTR_CURSOR_PATH", tmp_path / "nostr_cursors.json")
+    monkeypatch.setattr(pulse, "_NOSTR_CURSORS", None)
+    monkeypatch.setattr(pulse, "NOSTR_RELAYS", ["wss://a", "wss://b"])
+    return tmp_path / "nostr_cursors.json"
+
+
+def _serve(monkeypatch, notes_by_relay):
+    seen_since = {}
+
+    def fetch(relay, since, limit_total):
+        seen_since[relay] = since
+        return notes_by_relay.get(relay, [])
+
+    monkeypatch.setattr(pulse, "_fetch_relay_notes", fetch)
+    return seen_since
+
+
+def test_nostr_cursor_advances_to_returned_notes_only(monkeypatch, nostr_cursors):
+    now = int(pulse.time.time())
+    _serve(monkeypatch, {
+        "wss://a": [_note(1, now - 10), _note(2, now - 20)],
+        # Relay b repeats note 1 and has its oldest note cut by the limit.
+        "wss://b": [_note(1, now - 10), _note(4, now - 15), _note(3, now - 30)],
+    })
+    updates = {}
+
+    items = pulse.fetch_pulse_nostr([], limit_total=3, cursor_key="t", cursor_updates=updates)
+
+    assert [i["external_id"] for i in items] == ["nostr_1", "nostr_2", "nostr_4"]
+    assert updates["t|wss://a"] == now - 10
+    # Stays behind the dropped note so the next call fetches it again.
+    assert updates["t|wss://b"] == now - 31
+    # Nothing is persisted until the caller saves.
+    assert not nostr_cursors.exists()
+
+
+def test_nostr_cursor_round_trip_sets_since(monkeypatch, nostr_cursors, clock):
+    monkeypatch.setattr(pulse, "time", clock)
+    now = int(clock.now)
+    pulse._save_nostr_cursors({"t|wss://a": now - 100})
+    monkeypatch.setattr(pulse, "_NOSTR_CURSORS", None)
+    seen_since = _serve(monkeypatch, {})
+
+    pulse.fetch_pulse_nostr([], cursor_key="t", cursor_updates={})
+
+    assert seen_since["wss://a"] == now - 99
+    assert seen_since["wss://b"] == now - 7200
+
+
+class FakeSession:
+    def __init__(self, fail):
+        self.fail = fail
+        self.committed = self.rolled_back = False
+
+    def execute(self, stmt):
+        return SimpleNamespace(rowcount=len(stmt))
+
+    def commit(self):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+@pytest.fixture
+def ingest(monkeypatch, nostr_cursors):
+    now = int(pulse.time.time())
+    _serve(monkeypatch, {"wss://a": [_note(1, now - 10)]})
+    monkeypatch.setattr(pulse, "load_kol_list", lambda: {})
+    monkeypatch.setattr(pulse, "fetch_pulse_x", lambda *a, **k: [])
+    monkeypatch.setattr(pulse, "fetch_pulse_youtube", lambda *a, **k: [])
+    monkeypatch.setattr(pulse, "_models", lambda: SimpleNamespace(KOLPulseItem=object))
+    monkeypatch.setattr(pulse, "_insert_ignore", lambda db, model, rows, key: rows)
+
+    def run(fail):
+        session = FakeSession(fail)
+        monkeypatch.setattr(pulse, "_db", lambda: SimpleNamespace(session=session))
+        return pulse.ingest_pulse(), session
+
+    return run
+
+
+def test_ingest_saves_nostr_cursors_after_commit(ingest, nostr_cursors):
+    inserted, session = ingest(fail=False)
+
+    assert inserted == 1 and session.committed
+    assert "ingest|wss://a" in nostr_cursors.read_text()
+
+
+def test_ingest_keeps_nostr_cursors_on_rollback(ingest, nostr_cursors):
+    inserted, session = ingest(fail=True)
+
+    assert inserted == 0 and session.rolled_back
+    assert not nostr_cursors.exists()
+
+
+class FakeYouTube:
+    """Just enough of the discovery client for channels.list + a playlistItems batch."""
+
+    def __init__(self, uploads):
+        self.uploads = uploads  # channel id -> [video ids]
+        self.channel_calls = []
+        self.batched = []
+
+    def channels(self):
+        return SimpleNamespace(list=self._channels_list)
+
+    def _channels_list(self, part, id, maxResults):
+        self.channel_calls.append(id.split(","))
+        items = [
+            {"contentDetails": {"relatedPlaylists": {"uploads": f"UU{cid}"}}}
+            for cid in id.split(",") if cid in self.uploads
+        ]
+        return SimpleNamespace(execute=lambda: {"items": items})
+
+    def playlistItems(self):
+        return SimpleNamespace(list=lambda part, playlistId, maxResults: (playlistId, maxResults))
+
+    def new_batch_http_request(self, callback):
+        api = self
+        queued = []
+
+        class Batch:
+            def add(self, request, request_id):
+                queued.append((request_id, request))
+
+            def execute(self):
+                for request_id, (playlist, limit) in queued:
+                    api.batched.append(playlist)
+                    videos = api.uploads[playlist[2:]][:limit]
+                    callback(request_id, {"items": [
+                        {"snippet": {"resourceId": {"videoId": v}, "title": v, "channelTitle": playlist[2:]}}
+                        for v in videos
+                    ]}, None)
+
+        return Batch()
+
+
+def test_youtube_uploads_resolved_in_one_channels_call(monkeypatch):
+    api = FakeYouTube({"c1": ["v1", "v2"], "c2": ["v3"]})
+    bucket = TokenBucket(100, 1e-9)
+    monkeypatch.setattr(pulse, "_YT_API", api)
+    monkeypatch.setattr(pulse, "_YT_BUCKET", bucket)
+
+    items = pulse.fetch_pulse_youtube(["c1", "c2", "missing"], limit_per_channel=1)
+
+    assert api.channel_calls == [["c1", "c2", "missing"]]
+    assert api.batched == ["UUc1", "UUc2"]
+    assert [i["external_id"] for i in items] == ["yt_v1", "yt_v3"]
+    # One unit for channels.list plus one per playlistItems.list.
+    assert int(bucket._tokens) == 97
+
+
+def test_youtube_skips_when_quota_exhausted(monkeypatch, caplog):
+    api = FakeYouTube({"c1": ["v1"]})
+    monkeypatch.setattr(pulse, "_YT_API", api)
+    monkeypatch.setattr(pulse, "_YT_BUCKET", TokenBucket(1, 1e-9))
+    pulse._YT_BUCKET.acquire(timeout=0)
+
+    with caplog.at_level(logging.WARNING):
+        assert pulse.fetch_pulse_youtube(["c1"]) == []
+    assert api.channel_calls == []
+    assert "quota budget exhausted" in caplog.text
+
+
+def test_youtube_blank_channel_ids_spend_no_quota(monkeypatch):
+    api = FakeYouTube({})
+    bucket = TokenBucket(100, 1e-9)
+    monkeypatch.setattr(pulse, "_YT_API", api)
+    monkeypatch.setattr(pulse, "_YT_BUCKET", bucket)
+
+    assert pulse.fetch_pulse_youtube(["", None]) == []
+    assert api.channel_calls == []
+    assert int(bucket._tokens) == 100
+
+
+def test_youtube_logs_when_playlist_quota_runs_out(monkeypatch, caplog):
+    api = FakeYouTube({"c1": ["v1"], "c2": ["v2"]})
+    monkeypatch.setattr(pulse, "_YT_API", api)
+    # Enough for channels.list but not for both playlistItems calls.
+    monkeypatch.setattr(pulse, "_YT_BUCKET", TokenBucket(2, 1e-9))
+
+    with caplog.at_level(logging.WARNING):
+        assert pulse.fetch_pulse_youtube(["c1", "c2"]) == []
+    assert api.batched == []
+    assert "skipped 2 playlist(s)" in caplog.text
@@ -0,0 +1,46 @@
+from services import rate_limiter
+from services.rate_limiter import TokenBucket
+
+
+def test_bucket_starts_full_and_refuses_past_capacity(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    bucket = TokenBucket(3, 1)
+    assert all(bucket.acquire(timeout=0) for _ in range(3))
+    assert bucket.acquire(timeout=0) is False
+
+
+def test_bucket_refills_at_rate(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    bucket = TokenBucket(2, 0.5)
+    assert bucket.acquire(2, timeout=0)
+    clock.advance(1)
+    assert bucket.acquire(timeout=0) is False
+    clock.advance(1)
+    assert bucket.acquire(timeout=0)
+
+
+def test_refill_is_capped_at_capacity(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    bucket = TokenBucket(2, 1)
+    clock.advance(3600)
+    assert bucket.acquire(2, timeout=0)
+    assert bucket.acquire(timeout=0) is False
+
+
+def test_acquire_waits_within_timeout(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    bucket = TokenBucket(1, 1)
+    assert bucket.acquire()
+    start = clock.now
+    assert bucket.acquire(timeout=2)
+    assert clock.now - start == 1
+
+
+def test_acquire_gives_up_when_wait_exceeds_timeout(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    bucket = TokenBucket(1, 0.1)
+    assert bucket.acquire()
+    start = clock.now
+    assert bucket.acquire(timeout=5) is False
+    # Refusal is decided up front, without sleeping through the timeout.
+    assert clock.now == start
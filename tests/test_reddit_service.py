@@ -0,0 +1,101 @@
+import pytest
+
+from services import reddit_service as reddit
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch, clock):
+    monkeypatch.setattr(reddit, "time", clock)
+    reddit.cache_clear()
+    yield
+    reddit.cache_clear()
+
+
+def test_cached_value_expires_after_ttl(clock):
+    reddit._cache_set("k", [1], ttl=10)
+    assert reddit._cache_get("k") == [1]
+
+    clock.advance(10)
+    assert reddit._cache_get("k") is None
+    assert "k" not in reddit._RESPONSE_CACHE
+
+
+def test_full_cache_drops_expired_entries_first(monkeypatch, clock):
+    monkeypatch.setattr(reddit, "_RESPONSE_CACHE_MAX", 3)
+    reddit._cache_set("old", 1, ttl=5)
+    reddit._cache_set("a", 2, ttl=60)
+    reddit._cache_set("b", 3, ttl=60)
+    clock.advance(5)
+
+    reddit._cache_set("c", 4, ttl=60)
+
+    assert set(reddit._RESPONSE_CACHE) == {"a", "b", "c"}
+
+
+def test_full_cache_evicts_oldest_live_entry(monkeypatch):
+    monkeypatch.setattr(reddit, "_RESPONSE_CACHE_MAX", 2)
+    reddit._cache_set("a", 1, ttl=60)
+    reddit._cache_set("b", 2, ttl=60)
+
+    reddit._cache_set("c", 3, ttl=60)
+
+    assert reddit._cache_get("a") is None
+    assert reddit._cache_get("b") == 2 and reddit._cache_get("c") == 3
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def service():
+    svc = reddit.RedditService()
+    svc.session.close()
+    return svc
+
+
+def test_not_modified_reuses_prior_payload(service):
+    service.session = FakeSession(
+        FakeResponse(200, b'{"data": 1}', {"ETag": '"v1"', "Last-Modified": "Sun, 18 Oct 2026 00:00:00 GMT"}),
+        FakeResponse(304),
+    )
+    url = "https://www.reddit.com/r/bitcoin/hot.json"
+
+    assert service._get_json(url, {"limit": 5}) == (200, {"data": 1})
+    assert service._get_json(url, {"limit": 5}) == (200, {"data": 1})
+
+    assert service.session.sent_headers == [
+        {},
+        {"If-None-Match": '"v1"', "If-Modified-Since": "Sun, 18 Oct 2026 00:00:00 GMT"},
+    ]
+
+
+def test_validators_are_keyed_by_params(service):
+    service.session = FakeSession(
+        FakeResponse(200, b'{"data": 1}', {"ETag": '"v1"'}),
+        FakeResponse(200, b'{"data": 2}'),
+    )
+    url = "https://www.reddit.com/r/bitcoin/hot.json"
+
+    service._get_json(url, {"limit": 5})
+    assert service._get_json(url, {"limit": 10}) == (200, {"data": 2})
+    assert service.session.sent_headers[1] == {}
+
+
+def test_error_status_returns_no_data(service):
+    service.session = FakeSession(FakeResponse(429))
+
+    assert service._get_json("https://www.reddit.com/r/bitcoin/hot.json") == (429, None)
@@ -0,0 +1,159 @@
+import dataclasses
+import sys
+import threading
+import time
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from services import scheduler
+
+
+@pytest.fixture
+def tasks(monkeypatch):
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow(ctx):
+        started.set()
+        release.wait(5)
+        return {"success": True, "message": "slow done", "result": None}
+
+    dispatch = {
+        "fast": lambda ctx: {"success": True, "message": "fast done", "result": None},
+        "slow": slow,
+        "late": lambda ctx: {"success": True, "message": "late done", "result": None},
+    }
+    monkeypatch.setattr(scheduler, "TASKS", {name: {} for name in dispatch})
+    monkeypatch.setattr(scheduler, "_DISPATCH", dispatch)
+    monkeypatch.setattr(scheduler, "RUN_ALL_WORKERS", 1)
+    monkeypatch.setattr(scheduler, "RUN_ALL_TASK_TIMEOUT", 0.1)
+    yield started
+    release.set()
+    # Let the orphaned worker leave run_task so the next test starts with no task in flight.
+    for _ in range(100):
+        if not scheduler._running_tasks:
+            break
+        time.sleep(0.01)
+
+
+def test_run_all_due_reports_timed_out_tasks(tasks):
+    by_name = {r["task"]: r for r in scheduler.run_all_due()}
+
+    assert by_name["fast"]["success"] is True
+    assert by_name["slow"]["running"] is True
+    assert by_name["slow"]["message"] == "still running"
+    assert by_name["late"]["message"] == "not started before the deadline"
+
+
+def test_orphaned_task_is_not_started_twice(tasks):
+    scheduler.run_all_due()
+    assert tasks.is_set()
+
+    out = scheduler.run_task("slow")
+
+    assert out["skipped"] is True
+    assert out["reason"] == "running"
+
+
+
+@pytest.fixture
+def reel(monkeypatch, clock):
+    monkeypatch.setattr(scheduler, "time", clock)
+    monkeypatch.setattr(scheduler, "_reel_last_run", 0.0)
+    state = SimpleNamespace(runs=0, ok=True)
+
+    def auto_viral_reel():
+        state.runs += 1
+        return {"success": state.ok, "message": "", "result": None}
+
+    monkeypatch.setattr(scheduler, "auto_viral_reel", auto_viral_reel)
+    return state
+
+
+def test_reel_runs_once_per_window(reel, clock):
+    assert scheduler._task_auto_viral_reel()["success"] is True
+
+    out = scheduler._task_auto_viral_reel()
+    assert out["skipped"] is True and out["reason"] == "dedup"
+
+    clock.advance(scheduler.REEL_MIN_INTERVAL_S)
+    scheduler._task_auto_viral_reel()
+    assert reel.runs == 2
+
+
+def test_failed_reel_does_not_open_window(reel):
+    reel.ok = False
+    scheduler._task_auto_viral_reel()
+
+    reel.ok = True
+    assert scheduler._task_auto_viral_reel()["success"] is True
+    assert reel.runs == 2
+
+
+def test_reel_skips_while_another_run_holds_the_lock(reel):
+    with scheduler._reel_lock:
+        out = scheduler._task_auto_viral_reel()
+
+    assert out["skipped"] is True and out["reason"] == "running"
+    assert reel.runs == 0
+
+
+class FakeSendGrid:
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return SimpleNamespace(status_code=status)
+
+
+@pytest.fixture
+def alerts(monkeypatch, clock):
+    monkeypatch.setattr(scheduler, "time", clock)
+    monkeypatch.setattr(scheduler, "_alert_cache", {})
+    monkeypatch.setattr(scheduler, "ENV", dataclasses.replace(scheduler.ENV, alert_email="ops@example.com"))
+    mail = types.ModuleType("sendgrid.helpers.mail")
+    mail.Mail = lambda **kwargs: kwargs
+    mail.To = mail.Content = lambda *args: args
+    monkeypatch.setitem(sys.modules, "sendgrid.helpers.mail", mail)
+
+    def use(client):
+        monkeypatch.setattr(scheduler, "_get_sg_client", lambda: (client, "sender"))
+        return client
+
+    return use
+
+
+def test_repeated_alert_is_sent_once_per_window(alerts, clock):
+    client = alerts(FakeSendGrid(202, 202))
+
+    assert scheduler._send_alert_email("task failed", "boom") is True
+    assert scheduler._send_alert_email("task failed", "boom") is False
+    assert scheduler._send_alert_email("other task failed", "boom") is True
+    assert len(client.sent) == 2
+
+    clock.advance(scheduler.ALERT_DEDUP_S)
+    client.statuses.append(202)
+    assert scheduler._send_alert_email("task failed", "boom") is True
+
+
+def test_failed_alert_is_retried(alerts):
+    client = alerts(FakeSendGrid(RuntimeError("timeout"), 500, 202))
+
+    assert scheduler._send_alert_email("task failed", "boom") is False
+    assert scheduler._send_alert_email("task failed", "boom") is False
+    assert scheduler._send_alert_email("task failed", "boom") is True
+    assert len(client.sent) == 3
+
+
+def test_scheduler_status_jobs_are_copies():
+    jobs = scheduler.get_scheduler_status()["jobs"]
+    jobs[0]["badge"] = "hot"
+
+    assert "badge" not in scheduler.get_scheduler_status()["jobs"][0]